@@ -18,77 +18,145 @@ Knowledge Extraction:
     $ truthgit axioms --promote
 """
 
-from .extractor import (
-    Contradiction,
-    ContradictionSeverity,
-    ExtractionResult,
-    KnowledgeExtractor,
-    Pattern,
-    PatternType,
-    extract_from_text,
-)
-
-# Ontological Classification (v0.5.0)
-from .fallacy_detector import (
-    FallacyCategory,
-    FallacyMatch,
-    FallacyResult,
-    detect_fallacies,
-)
-from .hashing import content_hash, short_hash, verify_hash
-from .hypothesis_tester import (
-    EpistemicStatus,
-    HypothesisResult,
-    HypothesisType,
-    evaluate_hypothesis,
-)
-from .objects import (
-    Axiom,
-    AxiomType,
-    Claim,
-    ClaimCategory,
-    ClaimState,
-    ConsensusResult,
-    ConsensusType,
-    Context,
-    TruthObject,
-    Verification,
-    calculate_consensus,
-)
-from .ontological_classifier import (
-    ConsensusStatus,
-    DisagreementAnalysis,
-    DisagreementType,
-    OntologicalConsensus,
-    calculate_ontological_consensus,
-    classify_disagreement,
-)
-from .proof import (
-    ProofCertificate,
-    ProofManager,
-    verify_proof_standalone,
-)
-from .repository import TruthRepository
-from .sync import (
-    DocumentSync,
-    SyncedFile,
-    SyncResult,
-    SyncState,
-    sync_docs,
-)
-from .validators import (
-    ClaudeValidator,
-    GeminiValidator,
-    GPTValidator,
-    HuggingFaceValidator,
-    HumanValidator,
-    Logos6Validator,
-    OllamaValidator,
-    ValidationResult,
-    Validator,
-    get_default_validators,
-    validate_claim,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .extractor import (
+        Contradiction,
+        ContradictionSeverity,
+        ExtractionResult,
+        KnowledgeExtractor,
+        Pattern,
+        PatternType,
+        extract_from_text,
+    )
+
+    # Ontological Classification (v0.5.0)
+    from .fallacy_detector import (
+        FallacyCategory,
+        FallacyMatch,
+        FallacyResult,
+        detect_fallacies,
+    )
+    from .hashing import content_hash, short_hash, verify_hash
+    from .hypothesis_tester import (
+        EpistemicStatus,
+        HypothesisResult,
+        HypothesisType,
+        evaluate_hypothesis,
+    )
+    from .objects import (
+        Axiom,
+        AxiomType,
+        Claim,
+        ClaimCategory,
+        ClaimState,
+        ConsensusResult,
+        ConsensusType,
+        Context,
+        TruthObject,
+        Verification,
+        calculate_consensus,
+    )
+    from .ontological_classifier import (
+        ConsensusStatus,
+        DisagreementAnalysis,
+        DisagreementType,
+        OntologicalConsensus,
+        calculate_ontological_consensus,
+        classify_disagreement,
+    )
+    from .proof import (
+        ProofCertificate,
+        ProofManager,
+        verify_proof_standalone,
+    )
+    from .repository import RepositoryFormatError, TruthRepository
+    from .sync import (
+        DocumentSync,
+        SyncedFile,
+        SyncResult,
+        SyncState,
+        sync_docs,
+    )
+    from .validators import (
+        ClaudeValidator,
+        GeminiValidator,
+        GPTValidator,
+        HuggingFaceValidator,
+        HumanValidator,
+        Logos6Validator,
+        OllamaValidator,
+        ValidationResult,
+        Validator,
+        avalidate_claim,
+        get_default_validators,
+        validate_claim,
+        validate_claims,
+    )
+
+# Public names are imported on first access (PEP 562) so that `truthgit --help`
+# and `truthgit version` do not pay for the extractor, proof and validator stacks.
+_LAZY_IMPORTS = {
+    "Contradiction": ".extractor",
+    "ContradictionSeverity": ".extractor",
+    "ExtractionResult": ".extractor",
+    "KnowledgeExtractor": ".extractor",
+    "Pattern": ".extractor",
+    "PatternType": ".extractor",
+    "extract_from_text": ".extractor",
+    "FallacyCategory": ".fallacy_detector",
+    "FallacyMatch": ".fallacy_detector",
+    "FallacyResult": ".fallacy_detector",
+    "detect_fallacies": ".fallacy_detector",
+    "content_hash": ".hashing",
+    "short_hash": ".hashing",
+    "verify_hash": ".hashing",
+    "EpistemicStatus": ".hypothesis_tester",
+    "HypothesisResult": ".hypothesis_tester",
+    "HypothesisType": ".hypothesis_tester",
+    "evaluate_hypothesis": ".hypothesis_tester",
+    "Axiom": ".objects",
+    "AxiomType": ".objects",
+    "Claim": ".objects",
+    "ClaimCategory": ".objects",
+    "ClaimState": ".objects",
+    "ConsensusResult": ".objects",
+    "ConsensusType": ".objects",
+    "Context": ".objects",
+    "TruthObject": ".objects",
+    "Verification": ".objects",
+    "calculate_consensus": ".objects",
+    "ConsensusStatus": ".ontological_classifier",
+    "DisagreementAnalysis": ".ontological_classifier",
+    "DisagreementType": ".ontological_classifier",
+    "OntologicalConsensus": ".ontological_classifier",
+    "calculate_ontological_consensus": ".ontological_classifier",
+    "classify_disagreement": ".ontological_classifier",
+    "ProofCertificate": ".proof",
+    "ProofManager": ".proof",
+    "verify_proof_standalone": ".proof",
+    "RepositoryFormatError": ".repository",
+    "TruthRepository": ".repository",
+    "DocumentSync": ".sync",
+    "SyncedFile": ".sync",
+    "SyncResult": ".sync",
+    "SyncState": ".sync",
+    "sync_docs": ".sync",
+    "ClaudeValidator": ".validators",
+    "GeminiValidator": ".validators",
+    "GPTValidator": ".validators",
+    "HuggingFaceValidator": ".validators",
+    "HumanValidator": ".validators",
+    "Logos6Validator": ".validators",
+    "OllamaValidator": ".validators",
+    "ValidationResult": ".validators",
+    "Validator": ".validators",
+    "avalidate_claim": ".validators",
+    "get_default_validators": ".validators",
+    "validate_claim": ".validators",
+    "validate_claims": ".validators",
+}
 
 __version__ = "0.5.1"
 __author__ = "TruthGit"
@@ -113,6 +181,7 @@ __all__ = [
     "short_hash",
     # Repository
     "TruthRepository",
+    "RepositoryFormatError",
     # Extractor
     "KnowledgeExtractor",
     "Pattern",
@@ -137,8 +206,10 @@ __all__ = [
     "HuggingFaceValidator",
     "Logos6Validator",
     "HumanValidator",
+    "avalidate_claim",
     "get_default_validators",
     "validate_claim",
+    "validate_claims",
     # Proof
     "ProofCertificate",
     "ProofManager",
@@ -161,3 +232,19 @@ __all__ = [
     "HypothesisResult",
     "evaluate_hypothesis",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
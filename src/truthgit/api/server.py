@@ -3,17 +3,30 @@ TruthGit FastAPI Server
 Production-ready API for claim verification and proof generation.
 """
 
+import asyncio
 import base64
-import json
 import os
+import sys
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from datetime import datetime
-
-from fastapi import FastAPI, HTTPException
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated
+
+import blake3
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response
+from pydantic import AfterValidator, BaseModel, Field
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from truthgit.display import truncate
+from truthgit.hashing import content_hash
+from truthgit.objects import Claim, Verification
 from truthgit.proof import ProofManager, verify_proof_standalone
 from truthgit.repository import TruthRepository
 from truthgit.validators import (
@@ -21,6 +34,12 @@ from truthgit.validators import (
     GPTValidator,
     Logos6Validator,
     OllamaValidator,
+    ValidationResult,
+    Validator,
+    aclose_http,
+    avalidate_with_timeout,
+    check_claim,
+    close_http_client,
 )
 
 
@@ -36,22 +55,45 @@ def setup_gcp_credentials() -> bool:
     return False
 
 
+# Parsed config files keyed by path: (st_mtime_ns, config)
+_config_cache: dict[Path, tuple[int, dict]] = {}
+
+
 def load_repo_config(repo: TruthRepository) -> dict:
-    """Load config from repository's config file."""
-    if repo.config_file.exists():
-        with open(repo.config_file) as f:
-            return json.load(f)
-    return {}
+    """Load config from repository's config file (re-read only when it changes)."""
+    try:
+        mtime = repo.config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    cached = _config_cache.get(repo.config_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    config = orjson.loads(repo.config_file.read_bytes())
+    _config_cache[repo.config_file] = (mtime, config)
+    return config
 
 
 # Request/Response Models
+def _checked_claim(claim: str) -> str:
+    """Reject trivial or oversized claims with a 422, as validate_claim() would skip them."""
+    reason = check_claim(claim)
+    if reason is not None:
+        raise ValueError(reason)
+    return claim
+
+
+ClaimText = Annotated[str, AfterValidator(_checked_claim)]
+
+
 class VerifyRequest(BaseModel):
-    claim: str = Field(..., min_length=1, description="The claim to verify")
+    claim: ClaimText = Field(..., description="The claim to verify")
     domain: str = Field(default="general", description="Knowledge domain")
 
 
 class ProveRequest(BaseModel):
-    claim: str = Field(..., min_length=1, description="The claim to prove")
+    claim: ClaimText = Field(..., description="The claim to prove")
     domain: str = Field(default="general", description="Knowledge domain")
     format: str = Field(default="json", pattern="^(json|compact)$")
 
@@ -66,7 +108,8 @@ class SearchParams(BaseModel):
     limit: int = Field(default=10, ge=1, le=100)
 
 
-class ValidatorResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidatorResult:
     name: str
     confidence: float
     reasoning: str
@@ -87,10 +130,101 @@ class ApiResponse(BaseModel):
     meta: dict
 
 
+class VerificationCache:
+    """
+    Recent verifications keyed by claim content and domain.
+
+    Lets /api/prove sign a claim that was just checked by /api/verify
+    without running every validator again. Entries expire after `ttl`
+    seconds; the least recently used entry is evicted beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Claim, Verification, list[str]]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _key(claim: str, domain: str) -> str:
+        return content_hash({"content": claim, "domain": domain})
+
+    def get(self, claim: str, domain: str) -> tuple[Claim, Verification, list[str]] | None:
+        """Return (claim, verification, validator_names) if fresh, else None."""
+        key = self._key(claim, domain)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, claim_obj, verification, validator_names = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return claim_obj, verification, validator_names
+
+    def put(
+        self,
+        claim: str,
+        domain: str,
+        claim_obj: Claim,
+        verification: Verification,
+        validator_names: list[str],
+    ) -> None:
+        key = self._key(claim, domain)
+        self._entries[key] = (time.monotonic(), claim_obj, verification, validator_names)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 # Global repository instance
 repo: TruthRepository | None = None
 
 
+_API_CLOUD_VALIDATORS = (ClaudeValidator, GPTValidator)
+
+
+def select_validators() -> list[Validator]:
+    """Select API validators - prioritize Logos6 (our trained model on Vertex AI)."""
+    validators: list[Validator] = []
+
+    # Try Logos6 first (Vertex AI)
+    logos6 = Logos6Validator()
+    if logos6.is_available():
+        validators.append(logos6)
+
+    # Add cloud validators as backup
+    for validator_cls in _API_CLOUD_VALIDATORS:
+        v = validator_cls()
+        if v.is_available():
+            validators.append(v)
+
+    # Fallback to Ollama for local dev
+    if not validators:
+        validators = [
+            OllamaValidator(model="hermes3"),
+            OllamaValidator(model="nemotron-mini"),
+        ]
+
+    return validators
+
+
+async def run_validators(
+    validators: list[Validator], claim: str, domain: str
+) -> list[ValidationResult]:
+    """
+    Run validators concurrently, each bounded by its timeout.
+
+    Exceptions and timeouts are reported as error results. Claims that
+    validate_claim() would not send (trivial or oversized) are a 422.
+    """
+    reason = check_claim(claim)
+    if reason is not None:
+        raise HTTPException(status_code=422, detail=reason)
+    return await asyncio.gather(*(avalidate_with_timeout(v, claim, domain) for v in validators))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize repository and credentials on startup."""
@@ -107,20 +241,88 @@ async def lifespan(app: FastAPI):
     repo = TruthRepository()
     if not repo.is_initialized():
         repo.init()
+    repo.ensure_search_index()
     print("✅ TruthGit repository initialized")
 
+    # Resolve validators once; availability only depends on process environment
+    app.state.validators = select_validators()
+    print(f"✅ Validators: {', '.join(v.name for v in app.state.validators)}")
+    app.state.verify_cache = VerificationCache()
+
     yield
-    # Cleanup if needed
+
+    await aclose_http()
+    close_http_client()
+
+
+# Non-str keys (e.g. int-keyed counts) and numpy scalars from local models
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 
 
 # Create FastAPI app
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Defined here because fastapi.responses.ORJSONResponse is deprecated in
+    recent FastAPI releases. Endpoints return these directly, so FastAPI
+    skips its pure-Python jsonable_encoder pass.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
 app = FastAPI(
     title="TruthGit API",
     description="Version control for verified truth. Multi-validator AI consensus.",
     version="0.4.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+
+class ErrorEnvelopeMiddleware:
+    """
+    Report unexpected errors in the standard envelope.
+
+    Registered inside CORSMiddleware (unlike an Exception handler, which
+    Starlette runs in the outermost ServerErrorMiddleware) so that 500
+    responses still carry CORS headers. The exception is re-raised after
+    the response is sent so the server still logs it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if not started:
+                response = create_response(
+                    error=str(exc),
+                    start_time=scope.get("state", {}).get("start_time"),
+                    status_code=500,
+                )
+                await response(scope, receive, send)
+            raise
+
+
+app.add_middleware(ErrorEnvelopeMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -131,18 +333,102 @@ app.add_middleware(
 )
 
 
-def create_response(data: dict = None, error: str = None, start_time: float = None) -> dict:
+class RequestTimingMiddleware:
+    """Stamp each request with its start time for the response envelope."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["start_time"] = time.perf_counter_ns()
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(RequestTimingMiddleware)
+
+
+@lru_cache(maxsize=4)
+def _iso_timestamp(second: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    return _iso_timestamp(int(time.time()))
+
+
+def create_response(
+    data: dict = None, error: str = None, start_time: int = None, status_code: int = 200
+) -> ORJSONResponse:
     """Create standardized API response."""
-    processing_time = int((time.time() - start_time) * 1000) if start_time else 0
-    return {
-        "success": error is None,
-        "data": data,
-        "error": error,
-        "meta": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "processingTime": processing_time,
+    processing_time = (time.perf_counter_ns() - start_time) // 1_000_000 if start_time else 0
+    return ORJSONResponse(
+        {
+            "success": error is None,
+            "data": data,
+            "error": error,
+            "meta": {
+                "timestamp": utc_timestamp(),
+                "processingTime": processing_time,
+            },
         },
-    }
+        status_code=status_code,
+    )
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def etag_response(request: Request, data, start_time: int, tag_source=None) -> Response:
+    """
+    Standard response tagged with an ETag over its data.
+
+    The envelope meta (timestamp, processing time) is excluded so the tag only
+    changes with the payload; pass tag_source when data itself carries a
+    per-request value. Answers 304 when the client already holds it.
+    """
+    source = data if tag_source is None else tag_source
+    digest = blake3.blake3(orjson.dumps(source, option=ORJSON_OPTIONS)).hexdigest()
+    etag = f'"{digest[:16]}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response = create_response(data=data, start_time=start_time)
+    response.headers["ETag"] = etag
+    return response
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Wrap expected errors, including router 404/405s, in the standard envelope."""
+    response = create_response(
+        error=str(exc.detail),
+        start_time=getattr(request.state, "start_time", None),
+        status_code=exc.status_code,
+    )
+    if exc.headers:
+        response.headers.update(exc.headers)
+    return response
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Report invalid request bodies and parameters in the standard envelope."""
+    problems = [
+        f"{'.'.join(str(part) for part in error['loc'][1:]) or error['loc'][0]}: {error['msg']}"
+        for error in exc.errors()
+    ]
+    return create_response(
+        error="; ".join(problems),
+        start_time=getattr(request.state, "start_time", None),
+        status_code=422,
+    )
 
 
 @app.get("/")
@@ -263,369 +549,386 @@ async def debug_validators():
 
 
 @app.get("/api/status")
-async def get_status():
+async def get_status(request: Request):
     """Get repository status."""
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+
+    if not repo or not repo.is_initialized():
+        return etag_response(
+            request,
+            {
+                "initialized": False,
+                "objectCounts": {"claims": 0, "axioms": 0, "verifications": 0, "contexts": 0},
+                "consensusThreshold": 0.66,
+                "repoId": "",
+            },
+            start_time,
+        )
 
-    try:
-        if not repo or not repo.is_initialized():
-            return create_response(
-                data={
-                    "initialized": False,
-                    "objectCounts": {"claims": 0, "axioms": 0, "verifications": 0, "contexts": 0},
-                    "consensusThreshold": 0.66,
-                    "repoId": "",
-                },
-                start_time=start_time,
-            )
+    # Count objects using the repository method
+    counts = {"claims": 0, "axioms": 0, "verifications": 0, "contexts": 0}
 
-        # Count objects using the repository method
-        counts = {"claims": 0, "axioms": 0, "verifications": 0, "contexts": 0}
+    try:
+        object_counts = repo.count_objects()
+        counts["claims"] = object_counts.get("claim", 0)
+        counts["axioms"] = object_counts.get("axiom", 0)
+        counts["verifications"] = object_counts.get("verification", 0)
+        counts["contexts"] = object_counts.get("context", 0)
+    except Exception:
+        pass  # Use default zero counts
 
-        try:
-            object_counts = repo.count_objects()
-            counts["claims"] = object_counts.get("claim", 0)
-            counts["axioms"] = object_counts.get("axiom", 0)
-            counts["verifications"] = object_counts.get("verification", 0)
-            counts["contexts"] = object_counts.get("context", 0)
-        except Exception:
-            pass  # Use default zero counts
-
-        config = load_repo_config(repo)
-        return create_response(
-            data={
-                "initialized": True,
-                "objectCounts": counts,
-                "consensusThreshold": config.get("consensus_threshold", 0.66),
-                "repoId": config.get("repo_id", ""),
-            },
-            start_time=start_time,
-        )
-    except Exception as e:
-        return create_response(error=str(e), start_time=start_time)
+    config = load_repo_config(repo)
+    return etag_response(
+        request,
+        {
+            "initialized": True,
+            "objectCounts": counts,
+            "consensusThreshold": config.get("consensus_threshold", 0.66),
+            "repoId": config.get("repo_id", ""),
+        },
+        start_time,
+    )
 
 
 @app.post("/api/verify")
 async def verify_claim(request: VerifyRequest):
     """Verify a claim using multi-validator consensus."""
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+
+    if not repo:
+        raise HTTPException(status_code=500, detail="Repository not initialized")
+
+    validators = app.state.validators
+
+    # Run each validator and collect results
+    verifier_results: dict[str, tuple[float, str]] = {}
+    validator_details: list[ValidatorResult] = []
+
+    results = await run_validators(validators, request.claim, request.domain)
+
+    for result in results:
+        # Check if validator actually succeeded (no error)
+        if result.error:
+            # Log the error but continue to next validator
+            # Include both the reasoning (may have traceback) and error
+            reasoning_info = result.reasoning if result.reasoning else ""
+            error_info = result.error[:100] if result.error else "Unknown error"
+            if reasoning_info:
+                reasoning = f"{reasoning_info} | Error: {error_info}"
+            else:
+                reasoning = f"Error: {error_info}"
+            validator_details.append(
+                ValidatorResult(name=result.validator_name, confidence=0, reasoning=reasoning)
+            )
+            continue
 
-    try:
-        if not repo:
-            raise HTTPException(status_code=500, detail="Repository not initialized")
-
-        # Create claim first
-        claim = repo.claim(
-            content=request.claim,
-            domain=request.domain,
-            category="factual",
+        verifier_results[result.validator_name] = (
+            result.confidence,
+            result.reasoning,
         )
-
-        # Create validators - prioritize Logos6 (our trained model on Vertex AI)
-        validators = []
-
-        # Try Logos6 first (Vertex AI)
-        logos6 = Logos6Validator()
-        if logos6.is_available():
-            validators.append(logos6)
-
-        # Add cloud validators as backup
-        for v in [ClaudeValidator(), GPTValidator()]:
-            if v.is_available():
-                validators.append(v)
-
-        # Fallback to Ollama for local dev
-        if not validators:
-            validators = [
-                OllamaValidator(model="hermes3"),
-                OllamaValidator(model="nemotron-mini"),
-            ]
-
-        # Run each validator and collect results
-        verifier_results: dict[str, tuple[float, str]] = {}
-        validator_details = []
-
-        for validator in validators:
-            try:
-                result = validator.validate(request.claim, request.domain)
-                # Check if validator actually succeeded (no error)
-                if result.error:
-                    # Log the error but continue to next validator
-                    # Include both the reasoning (may have traceback) and error
-                    reasoning_info = result.reasoning if result.reasoning else ""
-                    error_info = result.error[:100] if result.error else "Unknown error"
-                    if reasoning_info:
-                        reasoning = f"{reasoning_info} | Error: {error_info}"
-                    else:
-                        reasoning = f"Error: {error_info}"
-                    validator_details.append(
-                        {
-                            "name": result.validator_name,
-                            "confidence": 0,
-                            "reasoning": reasoning,
-                        }
-                    )
-                    continue
-
-                verifier_results[result.validator_name] = (
-                    result.confidence,
-                    result.reasoning,
-                )
-                reasoning = result.reasoning
-                if len(reasoning) > 200:
-                    reasoning = reasoning[:200] + "..."
-                validator_details.append(
-                    {
-                        "name": result.validator_name,
-                        "confidence": result.confidence,
-                        "reasoning": reasoning,
-                    }
-                )
-            except Exception as e:
-                # Skip failed validators but log the error
-                validator_details.append(
-                    {
-                        "name": validator.name,
-                        "confidence": 0,
-                        "reasoning": f"Exception: {str(e)[:100]}",
-                    }
-                )
-                continue
-
-        if len(verifier_results) < 2:
-            num_success = len(verifier_results)
-            return create_response(
-                data={
-                    "passed": False,
-                    "consensus": 0.0,
-                    "validators": validator_details,
-                    "claimHash": claim.hash[:8],
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                },
-                error=f"Verification failed - {num_success} validators succeeded (need 2)",
-                start_time=start_time,
+        validator_details.append(
+            ValidatorResult(
+                name=result.validator_name,
+                confidence=result.confidence,
+                reasoning=truncate(result.reasoning),
             )
+        )
 
-        # Run verification with collected results
-        verification = repo.verify(verifier_results=verifier_results)
+    if len(verifier_results) < 2:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Verification failed - insufficient validators available "
+            f"({len(verifier_results)} succeeded, need 2)",
+        )
 
-        if not verification:
-            return create_response(
-                error="Verification failed",
-                start_time=start_time,
-            )
+    # Stage and commit only after every await, so concurrent requests
+    # cannot pick up each other's claims from the staging area
+    claim, verification = _commit_votes(request, verifier_results, list(verifier_results))
 
+    if not verification:
         return create_response(
-            data={
-                "passed": verification.consensus.passed,
-                "consensus": verification.consensus.value,
-                "validators": validator_details,
-                "claimHash": claim.hash[:8],
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-            },
+            error="Verification failed",
             start_time=start_time,
         )
 
-    except Exception as e:
-        return create_response(error=str(e), start_time=start_time)
+    return create_response(
+        data={
+            "passed": verification.consensus.passed,
+            "consensus": verification.consensus.value,
+            "validators": validator_details,
+            "claimHash": claim.hash[:8],
+            "timestamp": utc_timestamp(),
+        },
+        start_time=start_time,
+    )
+
+
+async def _collect_votes(claim: str, domain: str) -> tuple[dict[str, tuple[float, str]], list[str]]:
+    """Run the configured validators, keeping only successful votes."""
+    results = await run_validators(app.state.validators, claim, domain)
+
+    verifier_results: dict[str, tuple[float, str]] = {}
+    validator_names = []
+    for result in results:
+        # Skip validators that raised, timed out or returned errors
+        if result.error:
+            continue
+        verifier_results[result.validator_name] = (result.confidence, result.reasoning)
+        validator_names.append(result.validator_name)
+
+    return verifier_results, validator_names
+
+
+def _commit_votes(
+    request: VerifyRequest | ProveRequest,
+    verifier_results: dict[str, tuple[float, str]],
+    validator_names: list[str],
+) -> tuple[Claim, Verification | None]:
+    """Stage the claim, record the verification and cache it for reuse."""
+    claim = repo.claim(
+        content=request.claim,
+        domain=request.domain,
+        category="factual",
+    )
+    verification = repo.verify(verifier_results=verifier_results)
+    if verification:
+        app.state.verify_cache.put(
+            request.claim, request.domain, claim, verification, validator_names
+        )
+    return claim, verification
+
+
+def _proof_fields(claim: Claim, verification: Verification, validator_names: list[str]) -> dict:
+    """Keyword arguments for ProofManager.create_proof / create_batch_proof."""
+    return {
+        "claim_hash": claim.hash,
+        "claim_content": claim.content,
+        "claim_domain": claim.domain,
+        "verification_hash": verification.hash,
+        "consensus_value": verification.consensus.value,
+        "consensus_passed": verification.consensus.passed,
+        "validators": validator_names,
+    }
+
+
+def _load_proof_manager() -> ProofManager:
+    proof_manager = ProofManager(repo.root)
+    if not proof_manager.keys_exist:
+        proof_manager.generate_keypair()
+    return proof_manager
 
 
 @app.post("/api/prove")
 async def generate_proof(request: ProveRequest):
     """Generate a cryptographic proof certificate."""
-    start_time = time.time()
-
-    try:
-        if not repo:
-            raise HTTPException(status_code=500, detail="Repository not initialized")
-
-        # First verify the claim
-        claim = repo.claim(
-            content=request.claim,
-            domain=request.domain,
-            category="factual",
-        )
+    start_time = time.perf_counter_ns()
 
-        # Create validators - prioritize Logos6 (Vertex AI)
-        validators = []
-        logos6 = Logos6Validator()
-        if logos6.is_available():
-            validators.append(logos6)
-        for v in [ClaudeValidator(), GPTValidator()]:
-            if v.is_available():
-                validators.append(v)
-        if not validators:
-            validators = [OllamaValidator(model="hermes3"), OllamaValidator(model="nemotron-mini")]
-
-        # Run each validator and collect results
-        verifier_results: dict[str, tuple[float, str]] = {}
-        validator_names = []
-
-        for validator in validators:
-            try:
-                result = validator.validate(request.claim, request.domain)
-                # Skip validators that returned errors
-                if result.error:
-                    continue
-                verifier_results[result.validator_name] = (result.confidence, result.reasoning)
-                validator_names.append(result.validator_name)
-            except Exception:
-                continue
+    if not repo:
+        raise HTTPException(status_code=500, detail="Repository not initialized")
 
+    # Reuse a recent /api/verify result for the same claim if available
+    cached = app.state.verify_cache.get(request.claim, request.domain)
+    if cached:
+        claim, verification, validator_names = cached
+    else:
+        verifier_results, validator_names = await _collect_votes(request.claim, request.domain)
         if len(verifier_results) < 2:
-            return create_response(
-                error="Verification failed - insufficient validators available",
-                start_time=start_time,
-            )
-
-        verification = repo.verify(verifier_results=verifier_results)
-
-        if not verification or not verification.consensus.passed:
-            return create_response(
-                error="Claim did not pass verification",
-                start_time=start_time,
+            raise HTTPException(
+                status_code=503,
+                detail="Verification failed - insufficient validators available",
             )
+        claim, verification = _commit_votes(request, verifier_results, validator_names)
 
-        # Generate proof certificate using ProofManager
-        proof_manager = ProofManager(repo.root)
-        if not proof_manager.keys_exist:
-            proof_manager.generate_keypair()
-
-        certificate = proof_manager.create_proof(
-            claim_hash=claim.hash,
-            claim_content=claim.content,
-            claim_domain=claim.domain,
-            verification_hash=verification.hash,
-            consensus_value=verification.consensus.value,
-            consensus_passed=verification.consensus.passed,
-            validators=validator_names,
+    if not verification or not verification.consensus.passed:
+        return create_response(
+            error="Claim did not pass verification",
+            start_time=start_time,
         )
 
-        if request.format == "compact":
-            return create_response(
-                data={"certificate": certificate.to_compact()},
-                start_time=start_time,
-            )
+    # Generate proof certificate using ProofManager
+    certificate = _load_proof_manager().create_proof(
+        **_proof_fields(claim, verification, validator_names)
+    )
 
+    if request.format == "compact":
         return create_response(
-            data={"certificate": certificate.to_dict()},
+            data={"certificate": certificate.to_compact()},
             start_time=start_time,
         )
 
-    except Exception as e:
-        return create_response(error=str(e), start_time=start_time)
+    return create_response(
+        data={"certificate": certificate.to_dict()},
+        start_time=start_time,
+    )
+
+
+MAX_PROVE_BATCH = 100
+
+
+@app.post("/api/prove-batch")
+async def generate_batch_proof(requests: list[ProveRequest]):
+    """Generate proof certificates for several claims under one signature."""
+    start_time = time.perf_counter_ns()
+
+    if not repo:
+        raise HTTPException(status_code=500, detail="Repository not initialized")
+    if not requests:
+        raise HTTPException(status_code=400, detail="No claims to prove")
+    if len(requests) > MAX_PROVE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PROVE_BATCH} claims per batch")
+
+    cached = [app.state.verify_cache.get(r.claim, r.domain) for r in requests]
+    pending = [r for r, hit in zip(requests, cached) if not hit]
+    votes = iter(await asyncio.gather(*(_collect_votes(r.claim, r.domain) for r in pending)))
+
+    # Claims are committed one at a time: repo.verify consumes the whole staging area
+    outcomes: list[ProveRequest | str] = []
+    proof_fields = []
+    for request, hit in zip(requests, cached):
+        if hit:
+            claim, verification, validator_names = hit
+        else:
+            verifier_results, validator_names = next(votes)
+            if len(verifier_results) < 2:
+                outcomes.append("Verification failed - insufficient validators available")
+                continue
+            claim, verification = _commit_votes(request, verifier_results, validator_names)
+
+        if not verification or not verification.consensus.passed:
+            outcomes.append("Claim did not pass verification")
+            continue
+
+        outcomes.append(request)
+        proof_fields.append(_proof_fields(claim, verification, validator_names))
+
+    certificates = iter(_load_proof_manager().create_batch_proof(proof_fields))
+
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, str):
+            results.append({"certificate": None, "error": outcome})
+            continue
+        certificate = next(certificates)
+        if outcome.format == "compact":
+            results.append({"certificate": certificate.to_compact(), "error": None})
+        else:
+            results.append({"certificate": certificate.to_dict(), "error": None})
+
+    return create_response(data={"results": results}, start_time=start_time)
 
 
 @app.post("/api/verify-proof")
 async def verify_proof_endpoint(request: VerifyProofRequest):
     """Verify a proof certificate."""
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
-    try:
-        is_valid, message, cert = verify_proof_standalone(request.certificate)
-
-        if cert is None:
-            return create_response(
-                data={
-                    "valid": False,
-                    "message": message,
-                    "claim": {},
-                    "verification": {},
-                },
-                start_time=start_time,
-            )
+    is_valid, message, cert = verify_proof_standalone(request.certificate)
 
+    if cert is None:
         return create_response(
             data={
-                "valid": is_valid,
+                "valid": False,
                 "message": message,
-                "claim": {
-                    "content": cert.claim_content,
-                    "domain": cert.claim_domain,
-                },
-                "verification": {
-                    "consensus": cert.consensus_value,
-                    "validators": cert.validators,
-                    "timestamp": cert.timestamp,
-                },
+                "claim": {},
+                "verification": {},
             },
             start_time=start_time,
         )
 
-    except Exception as e:
-        return create_response(error=str(e), start_time=start_time)
+    return create_response(
+        data={
+            "valid": is_valid,
+            "message": message,
+            "claim": {
+                "content": cert.claim_content,
+                "domain": cert.claim_domain,
+            },
+            "verification": {
+                "consensus": cert.consensus_value,
+                "validators": cert.validators,
+                "timestamp": cert.timestamp,
+            },
+        },
+        start_time=start_time,
+    )
 
 
 @app.get("/api/search")
-async def search_claims(query: str, domain: str | None = None, limit: int = 10):
+async def search_claims(request: Request, query: str, domain: str | None = None, limit: int = 10):
     """Search for verified claims."""
-    start_time = time.time()
-
-    try:
-        if not repo:
-            raise HTTPException(status_code=500, detail="Repository not initialized")
+    start_time = time.perf_counter_ns()
 
-        results = repo.search(query=query, domain=domain, limit=limit)
+    if not repo:
+        raise HTTPException(status_code=500, detail="Repository not initialized")
 
-        claims = []
-        for result in results:
-            claims.append(
-                {
-                    "hash": result.hash[:8] if hasattr(result, "hash") else "",
-                    "content": result.content if hasattr(result, "content") else str(result),
-                    "domain": result.domain if hasattr(result, "domain") else "general",
-                    "consensus": result.consensus if hasattr(result, "consensus") else 0,
-                    "status": result.status.value if hasattr(result, "status") else "VERIFIED",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                }
-            )
+    results = repo.search(query=query, domain=domain, limit=limit)
 
-        return create_response(data=claims, start_time=start_time)
+    timestamp = utc_timestamp()
+    claims = [
+        {
+            "hash": r.hash[:8],
+            "content": r.content,
+            "domain": r.domain,
+            "consensus": r.consensus,
+            "status": r.status,
+            "timestamp": timestamp,
+        }
+        for r in results
+    ]
 
-    except Exception:
-        return create_response(data=[], start_time=start_time)
+    return etag_response(request, claims, start_time, tag_source=results)
 
 
 @app.get("/api/claims")
-async def get_recent_claims(limit: int = 10):
+async def get_recent_claims(request: Request, limit: int = 10):
     """Get recent claims."""
-    start_time = time.time()
-
-    try:
-        if not repo:
-            return create_response(data=[], start_time=start_time)
+    start_time = time.perf_counter_ns()
 
-        # Get recent verifications
-        results = repo.log(limit=limit)
+    if not repo:
+        return etag_response(request, [], start_time)
 
-        claims = []
-        for result in results:
-            claims.append(
-                {
-                    "hash": result.get("hash", "")[:8],
-                    "content": result.get("content", ""),
-                    "domain": result.get("domain", "general"),
-                    "consensus": result.get("consensus", 0),
-                    "status": result.get("status", "VERIFIED"),
-                    "timestamp": result.get("timestamp", datetime.utcnow().isoformat() + "Z"),
-                }
-            )
+    # Get recent verifications
+    results = repo.log(limit=limit)
 
-        return create_response(data=claims, start_time=start_time)
+    timestamp = utc_timestamp()
+    claims = [
+        {
+            "hash": r.hash[:8],
+            "content": r.content,
+            "domain": r.domain,
+            "consensus": r.consensus,
+            "status": r.status,
+            "timestamp": r.timestamp or timestamp,
+        }
+        for r in results
+    ]
 
-    except Exception:
-        return create_response(data=[], start_time=start_time)
+    return etag_response(request, claims, start_time, tag_source=results)
 
 
 def run():
-    """Run the server."""
+    """
+    Run the server.
+
+    Uses uvloop + httptools in a single worker by default: the repository
+    staging area, the verification cache and the provider rate limits are
+    per-process, so extra workers race on .truth/ and multiply API usage.
+    TRUTHGIT_WORKERS opts into more workers; TRUTHGIT_RELOAD=1 runs a single
+    auto-reloading process for development.
+    """
     import uvicorn
 
+    reload = os.getenv("TRUTHGIT_RELOAD") == "1"
+    workers = None if reload else int(os.getenv("TRUTHGIT_WORKERS", "1"))
+
     uvicorn.run(
         "truthgit.api.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+        reload=reload,
     )
 
 
@@ -0,0 +1,169 @@
+"""
+TruthGit Response Cache - Persistent cache of validator verdicts.
+
+Re-validating an identical claim with the same validator, model and
+prompt returns the stored ValidationResult instead of another LLM
+round-trip.
+
+Entries live in a SQLite file (default ~/.truthgit/cache/responses.db,
+override with TRUTHGIT_CACHE_DIR) and expire after 7 days. Keys include
+the prompt version, so bumping validators.PROMPT_VERSION invalidates
+every stored verdict.
+
+Usage:
+    class MyValidator(Validator):
+        @cached_validation
+        def validate(self, claim, domain="general"): ...
+
+    validator.validate(claim, bypass_cache=True)  # force a fresh call
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+DEFAULT_TTL = 7 * 24 * 3600
+
+
+def default_cache_dir() -> Path:
+    """Cache directory, honouring TRUTHGIT_CACHE_DIR."""
+    return Path(os.getenv("TRUTHGIT_CACHE_DIR") or Path.home() / ".truthgit" / "cache")
+
+
+class ResponseCache:
+    """SQLite-backed store of ValidationResults keyed by content hash."""
+
+    def __init__(self, directory: str | Path | None = None, ttl: float = DEFAULT_TTL):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.path = self.directory / "responses.db"
+        self.ttl = ttl
+        self._local = threading.local()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL, prompt_version TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use and then reused."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=5)
+        return conn
+
+    @staticmethod
+    def key(validator_name: str, model: str, prompt_version: str, claim: str, domain: str) -> str:
+        """
+        Content hash identifying one validator verdict.
+
+        The fields are hashed as a JSON array, so separators inside a claim
+        or domain cannot make two different inputs collide.
+        """
+        raw = json.dumps([validator_name, model, prompt_version, claim, domain])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Stored ValidationResult for key, or None if missing or expired."""
+        from .validators import ValidationResult
+
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT result FROM responses WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return ValidationResult(**json.loads(row[0])) if row else None
+
+    def put(self, key: str, result, prompt_version: str):
+        """Store a ValidationResult under key."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(asdict(result)), now, now + self.ttl, prompt_version),
+            )
+
+    def prune(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def clear(self):
+        """Delete every entry."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+_CACHE: ResponseCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide ResponseCache for the current cache directory."""
+    global _CACHE
+    directory = default_cache_dir()
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.directory != directory:
+            _CACHE = ResponseCache(directory)
+        return _CACHE
+
+
+def cached_validation(func):
+    """
+    Cache a validator's validate()/avalidate() results.
+
+    The wrapped method gains a keyword-only bypass_cache argument that
+    skips the lookup (the fresh result still refreshes the entry). Only
+    successful results are stored, so errors are always retried. An
+    unusable cache directory degrades to uncached calls. The async wrapper
+    does its SQLite reads and writes in a worker thread.
+    """
+
+    def lookup(self, claim: str, domain: str, bypass_cache: bool):
+        try:
+            cache = get_response_cache()
+            key = cache.key(self.name, self.cache_tag, self.PROMPT_VERSION, claim, domain)
+            return cache, key, None if bypass_cache else cache.get(key)
+        except (OSError, sqlite3.Error):
+            return None, None, None
+
+    def store(self, cache: ResponseCache | None, key: str | None, result):
+        if cache is not None and result.success:
+            try:
+                cache.put(key, result, self.PROMPT_VERSION)
+            except (OSError, sqlite3.Error):
+                pass
+        return result
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, claim: str, domain: str = "general", *, bypass_cache=False):
+            # SQLite calls block, so keep them off the event loop
+            cache, key, hit = await asyncio.to_thread(lookup, self, claim, domain, bypass_cache)
+            if hit is not None:
+                return hit
+            result = await func(self, claim, domain)
+            return await asyncio.to_thread(store, self, cache, key, result)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, claim: str, domain: str = "general", *, bypass_cache=False):
+        cache, key, hit = lookup(self, claim, domain, bypass_cache)
+        if hit is not None:
+            return hit
+        return store(self, cache, key, func(self, claim, domain))
+
+    return wrapper
@@ -9,15 +9,19 @@ Usage:
     truthgit status                  Show repository status
 """
 
+from typing import TYPE_CHECKING
+
 import typer
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
-from . import TruthRepository, __version__
-from .objects import ObjectType, Verification
-from .ontological_classifier import ConsensusStatus, DisagreementType
+from .display import truncate
+from .objects import ObjectType
+
+if TYPE_CHECKING:
+    from .objects import Verification
+    from .repository import TruthRepository
 
 app = typer.Typer(
     name="truthgit",
@@ -27,13 +31,24 @@ app = typer.Typer(
 console = Console()
 
 
-def get_repo(path: str = ".truth") -> TruthRepository:
-    """Get repository instance."""
-    return TruthRepository(path)
+def get_repo(path: str = ".truth", check_format: bool = True) -> "TruthRepository":
+    """Get repository instance, exiting if it uses an unreadable format."""
+    from .repository import RepositoryFormatError, TruthRepository
+
+    repo = TruthRepository(path)
+    if check_format:
+        try:
+            repo.check_format()
+        except RepositoryFormatError as e:
+            rprint(f"[red]✗[/red] {e}")
+            raise typer.Exit(1)
+    return repo
 
 
-def _display_verification_result(verification: Verification, simple_mode: bool = False) -> None:
+def _display_verification_result(verification: "Verification", simple_mode: bool = False) -> None:
     """Display verification result with ontological awareness."""
+    from .ontological_classifier import ConsensusStatus, DisagreementType
+
     consensus = verification.consensus
     ontological = getattr(verification, "ontological_consensus", None)
 
@@ -73,9 +88,7 @@ def _display_verification_result(verification: Verification, simple_mode: bool =
         rprint("  [bold]Preserved positions:[/bold]")
         if ontological.preserved_positions:
             for validator, reasoning in ontological.preserved_positions.items():
-                # Truncate long reasonings
-                short_reasoning = reasoning[:60] + "..." if len(reasoning) > 60 else reasoning
-                rprint(f"    [cyan]{validator}[/cyan]: {short_reasoning}")
+                rprint(f"    [cyan]{validator}[/cyan]: {truncate(reasoning, 60)}")
         rprint("")
         rprint(f"  Verification: [bold]{verification.short_hash}[/bold]")
         rprint("\n[magenta]→ Disagreement preserved as valuable data[/magenta]")
@@ -108,6 +121,8 @@ def _display_verification_result(verification: Verification, simple_mode: bool =
 @app.command()
 def version():
     """Show TruthGit version."""
+    from . import __version__
+
     rprint(f"[bold]TruthGit[/bold] v{__version__}")
     rprint("https://truthgit.com")
 
@@ -118,7 +133,7 @@ def init(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing"),
 ):
     """Initialize a new truth repository."""
-    repo = get_repo(path)
+    repo = get_repo(path, check_format=False)
 
     try:
         repo.init(force=force)
@@ -230,7 +245,10 @@ def verify(
     rprint(f"[bold]Verifying {len(staged)} claim(s)...[/bold]\n")
 
     # Get validators
-    from .validators import get_default_validators, validate_claim
+    from rich.table import Table
+    from rich.text import Text
+
+    from .validators import get_default_validators, validate_claims
 
     try:
         validators = get_default_validators(local_only=local)
@@ -251,39 +269,39 @@ def verify(
 
     rprint(f"Using validators: {', '.join(v.name for v in validators)}\n")
 
-    # Validate each claim
-    all_results = {}
-    for item in staged:
-        claim_obj = repo.load(ObjectType.CLAIM, item["hash"])
-        if not claim_obj:
-            continue
-
-        rprint(f"[dim]Validating:[/dim] {claim_obj.content[:50]}...")
+    claim_objs = [repo.load(ObjectType.CLAIM, item["hash"]) for item in staged]
+    claim_objs = [c for c in claim_objs if c]
 
-        results, avg = validate_claim(
-            claim=claim_obj.content,
-            domain=claim_obj.domain,
-            validators=validators,
-        )
+    # Validate every claim in one fan-out, sharing connections and rate limits
+    validated = validate_claims(
+        [(c.content, c.domain) for c in claim_objs],
+        validators=validators,
+    )
 
+    all_results = {}
+    for claim_obj, (results, _) in zip(claim_objs, validated):
+        rprint(f"[dim]Validated:[/dim] {truncate(claim_obj.content, 50)}")
+
+        # One table per claim: a single render and write instead of one per validator
+        table = Table(box=None, show_header=False, padding=(0, 1, 0, 2))
+        table.add_column("Validator", style="cyan", no_wrap=True)
+        table.add_column("Confidence", justify="right")
+        table.add_column("Reasoning")
         for r in results:
             if r.success:
                 all_results[r.validator_name] = (r.confidence, r.reasoning)
-                rprint(f"  [{r.validator_name}] {r.confidence:.0%} - {r.reasoning[:40]}...")
+                table.add_row(
+                    r.validator_name, f"{r.confidence:.0%}", Text(truncate(r.reasoning, 40))
+                )
             else:
-                rprint(f"  [{r.validator_name}] [red]Error:[/red] {r.error}")
+                table.add_row(r.validator_name, "[red]Error[/red]", Text(str(r.error)))
+        console.print(table)
 
     # Create verification
     if all_results:
-        # Get claim content for ontological analysis
-        claim_content = ""
-        claim_domain = "general"
-        for item in staged:
-            claim_obj = repo.load(ObjectType.CLAIM, item["hash"])
-            if claim_obj:
-                claim_content = claim_obj.content
-                claim_domain = claim_obj.domain
-                break
+        # Claim content for ontological analysis
+        claim_content = claim_objs[0].content
+        claim_domain = claim_objs[0].domain
 
         verification = repo.verify(
             verifier_results=all_results,
@@ -305,6 +323,8 @@ def log(
     path: str = typer.Option(".truth", "--path", "-p", help="Repository path"),
 ):
     """Show verification history."""
+    from rich.table import Table
+
     repo = get_repo(path)
 
     if not repo.is_initialized():
@@ -347,21 +367,20 @@ def cat_object(
         rprint("[red]✗[/red] Not a truth repository")
         raise typer.Exit(1)
 
-    # Try to find object by prefix
-    for obj_type in ObjectType:
-        for obj in repo.iter_objects(obj_type):
-            if obj.hash.startswith(hash_prefix):
-                rprint(
-                    Panel.fit(
-                        f"[bold]{obj_type.value.upper()}[/bold] {obj.short_hash}",
-                        border_style="blue",
-                    )
-                )
-                rprint(obj.serialize())
-                return
+    found = repo.find_object_by_prefix(hash_prefix)
+    obj = repo.load(*found) if found else None
+    if not obj:
+        rprint(f"[red]✗[/red] Object not found: {hash_prefix}")
+        raise typer.Exit(1)
 
-    rprint(f"[red]✗[/red] Object not found: {hash_prefix}")
-    raise typer.Exit(1)
+    obj_type = found[0]
+    rprint(
+        Panel.fit(
+            f"[bold]{obj_type.value.upper()}[/bold] {obj.short_hash}",
+            border_style="blue",
+        )
+    )
+    rprint(obj.serialize())
 
 
 @app.command()
@@ -369,6 +388,8 @@ def validators(
     local: bool = typer.Option(False, "--local", "-l", help="Show only local"),
 ):
     """Show available validators."""
+    from rich.table import Table
+
     from .validators import (
         ClaudeValidator,
         GeminiValidator,
@@ -424,6 +445,8 @@ def extract(
     """Extract atomic claims from a document or text."""
     import os
 
+    from rich.table import Table
+
     from .extractor import KnowledgeExtractor
 
     repo = get_repo(path)
@@ -469,7 +492,7 @@ def extract(
     for claim in claims:
         table.add_row(
             claim.short_hash,
-            claim.content[:50] + ("..." if len(claim.content) > 50 else ""),
+            truncate(claim.content, 50),
             f"{claim.confidence:.0%}",
         )
 
@@ -486,6 +509,8 @@ def patterns(
     path: str = typer.Option(".truth", "--path", "-p", help="Repository path"),
 ):
     """Find patterns across verified claims."""
+    from rich.table import Table
+
     from .extractor import KnowledgeExtractor
 
     repo = get_repo(path)
@@ -521,7 +546,7 @@ def patterns(
         claims_str = ", ".join(h[:8] for h in p.claims)
         table.add_row(
             p.pattern_type.value,
-            p.description[:40] + ("..." if len(p.description) > 40 else ""),
+            truncate(p.description, 40),
             claims_str,
             f"{p.confidence:.0%}",
         )
@@ -536,6 +561,8 @@ def contradictions(
     path: str = typer.Option(".truth", "--path", "-p", help="Repository path"),
 ):
     """Detect contradictions between claims."""
+    from rich.table import Table
+
     from .extractor import KnowledgeExtractor
 
     repo = get_repo(path)
@@ -595,7 +622,7 @@ def contradictions(
             c.severity.value.upper(),
             c.claim_a_hash[:12],
             c.claim_b_hash[:12],
-            c.explanation[:35] + ("..." if len(c.explanation) > 35 else ""),
+            truncate(c.explanation, 35),
             f"{c.confidence:.0%}",
         )
 
@@ -617,6 +644,8 @@ def axioms(
     path: str = typer.Option(".truth", "--path", "-p", help="Repository path"),
 ):
     """Show axiom candidates and optionally promote them."""
+    from rich.table import Table
+
     from .extractor import KnowledgeExtractor
 
     repo = get_repo(path)
@@ -637,7 +666,7 @@ def axioms(
         for a in existing:
             table.add_row(
                 a.short_hash,
-                a.content[:50] + ("..." if len(a.content) > 50 else ""),
+                truncate(a.content, 50),
                 a.axiom_type.value,
                 a.domain,
             )
@@ -667,7 +696,7 @@ def axioms(
     for claim, avg_conf, num_verifications in candidates:
         table.add_row(
             claim.short_hash,
-            claim.content[:40] + ("..." if len(claim.content) > 40 else ""),
+            truncate(claim.content, 40),
             str(num_verifications),
             f"{avg_conf:.1%}",
         )
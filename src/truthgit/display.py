@@ -0,0 +1,8 @@
+"""
+TruthGit Display - Text helpers shared by the CLI and the API.
+"""
+
+
+def truncate(text: str, n: int = 200) -> str:
+    """Cut text to n characters, marking the cut with an ellipsis."""
+    return text if len(text) <= n else f"{text[:n]}..."
@@ -238,8 +238,10 @@ Only output valid JSON."""
         try:
             import httpx
 
+            from .validators import ollama_base_url
+
             response = httpx.post(
-                "http://localhost:11434/api/generate",
+                f"{ollama_base_url()}/api/generate",
                 json={
                     "model": self.parser_model,
                     "prompt": prompt,
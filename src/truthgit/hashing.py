@@ -1,17 +1,22 @@
 """
 TruthGit Hashing - Sistema de Content-Addressing
 
-Similar a Git, todo objeto se identifica por el hash SHA-256 de su contenido.
+Similar a Git, todo objeto se identifica por el hash BLAKE3 de su contenido.
 Esto garantiza:
 - Integridad: corrupción es detectable
 - Deduplicación: mismo contenido = mismo hash
 - Verificación: el hash ES la dirección
 """
 
-import hashlib
 import json
+from pathlib import Path
 from typing import Any
 
+import blake3
+
+# Algoritmo de content-addressing (formato de repositorio 2.0.0+)
+HASH_ALGORITHM = "blake3"
+
 
 def canonical_serialize(obj: dict[str, Any]) -> str:
     """
@@ -32,7 +37,7 @@ def canonical_serialize(obj: dict[str, Any]) -> str:
 
 def content_hash(content: str | dict[str, Any], prefix: str = "") -> str:
     """
-    Calcular hash SHA-256 del contenido.
+    Calcular hash BLAKE3 del contenido.
 
     Args:
         content: String o dict a hashear
@@ -53,7 +58,22 @@ def content_hash(content: str | dict[str, Any], prefix: str = "") -> str:
     if prefix:
         serialized = f"{prefix}\0{serialized}"
 
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return blake3.blake3(serialized.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str | Path) -> str:
+    """
+    Calcular hash BLAKE3 de un archivo sin cargarlo en memoria.
+
+    Usa mmap y el modo multihilo de BLAKE3 (árbol Merkle), útil para
+    documentos grandes.
+
+    Returns:
+        Hash hexadecimal de 64 caracteres
+    """
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(str(path))
+    return hasher.hexdigest()
 
 
 def verify_hash(content: str | dict[str, Any], expected_hash: str, prefix: str = "") -> bool:
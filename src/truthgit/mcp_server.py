@@ -23,7 +23,6 @@ Configuration for Claude Code (~/.claude/claude_desktop_config.json):
 """
 
 import asyncio
-import json
 from pathlib import Path
 
 from mcp.server import Server
@@ -187,7 +186,7 @@ async def _verify_claim(claim: str, domain: str, repo_path: Path) -> list[TextCo
     """Verify a claim with multi-validator consensus."""
     try:
         from .repository import TruthRepository
-        from .validators import get_default_validators
+        from .validators import avalidate_claim, get_default_validators
 
         # Initialize repo if needed
         repo = TruthRepository(str(repo_path))
@@ -208,18 +207,17 @@ async def _verify_claim(claim: str, domain: str, repo_path: Path) -> list[TextCo
                 )
             ]
 
-        # Verify claim
-        results = []
-        for v in validators:
-            result = v.validate(claim, domain)
-            results.append(
-                {
-                    "validator": v.name,
-                    "confidence": result.confidence,
-                    "reasoning": result.reasoning,
-                    "error": result.error,
-                }
-            )
+        # Verify claim (validators are queried concurrently)
+        validation, _ = await avalidate_claim(claim, domain, validators)
+        results = [
+            {
+                "validator": v.name,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+                "error": result.error,
+            }
+            for v, result in zip(validators, validation)
+        ]
 
         # Calculate consensus
         successful = [r for r in results if not r["error"]]
@@ -263,7 +261,7 @@ async def _prove_claim(claim: str, domain: str, format: str, repo_path: Path) ->
     try:
         from .proof import ProofManager
         from .repository import TruthRepository
-        from .validators import get_default_validators
+        from .validators import avalidate_claim, get_default_validators
 
         repo = TruthRepository(str(repo_path))
         if not repo.is_initialized():
@@ -279,10 +277,8 @@ async def _prove_claim(claim: str, domain: str, format: str, repo_path: Path) ->
         if len(validators) < 2:
             validators = get_default_validators(local_only=False)
 
-        results = []
-        for v in validators[:3]:  # Limit to 3 validators
-            result = v.validate(claim, domain)
-            results.append(result)
+        # Limit to 3 validators
+        results, _ = await avalidate_claim(claim, domain, validators[:3], min_validators=0)
 
         successful = [r for r in results if r.success]
         if not successful:
@@ -369,7 +365,7 @@ async def _search_claims(
 ) -> list[TextContent]:
     """Search for verified claims."""
     try:
-        from .objects import ObjectType
+        from .display import truncate
         from .repository import TruthRepository
 
         repo = TruthRepository(str(repo_path))
@@ -381,35 +377,18 @@ async def _search_claims(
                 )
             ]
 
-        # Search claims
-        results = []
-        query_lower = query.lower()
-
-        for claim in repo.iter_objects(ObjectType.CLAIM):
-            data = json.loads(claim.serialize())
-            content = data.get("content", "")
-            claim_domain = data.get("domain", "")
-
-            if query_lower in content.lower():
-                if domain is None or claim_domain == domain:
-                    results.append(
-                        {
-                            "hash": claim.compute_hash()[:8],
-                            "content": content,
-                            "domain": claim_domain,
-                            "confidence": data.get("confidence", 0),
-                        }
-                    )
-
-                    if len(results) >= limit:
-                        break
+        # Same full-text index as the CLI and the API
+        results = repo.search(query, domain=domain, limit=limit)
 
         if not results:
             text = f"No claims found matching '{query}'"
         else:
             text = f"## Search Results for '{query}'\n\n"
             for r in results:
-                text += f"- **[{r['hash']}]** ({r['domain']}) {r['content'][:80]}...\n"
+                text += (
+                    f"- **[{r.hash[:8]}]** ({r.domain}, {r.status} {r.consensus:.0%}) "
+                    f"{truncate(r.content, 80)}\n"
+                )
             text += f"\n*Found {len(results)} result(s)*"
 
         return [TextContent(type="text", text=text)]
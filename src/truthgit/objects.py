@@ -91,7 +91,7 @@ class TruthObject(ABC):
 
     @property
     def hash(self) -> str:
-        """Hash SHA-256 del contenido canónico."""
+        """Hash BLAKE3 del contenido canónico."""
         return content_hash(self.to_canonical(), prefix=self.object_type.value)
 
     @property
@@ -16,6 +16,9 @@ Certificate Format:
         "signature": "base64...",
         "public_key": "base64..."
     }
+
+Batch certificates share one signature over a Merkle root and add
+"batch": {"leaf", "index", "size", "siblings", "root"} to the proof section.
 """
 
 import base64
@@ -25,6 +28,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import blake3
+import orjson
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -48,9 +53,15 @@ class ProofCertificate:
     signature: str
     public_key: str
     repo_id: str = ""
+    batch: dict[str, Any] | None = None
+
+    @property
+    def kind(self) -> str:
+        """ "batch" if the signature covers a Merkle root, else "single"."""
+        return "batch" if self.batch else "single"
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        data = {
             "version": self.version,
             "claim": {
                 "hash": self.claim_hash,
@@ -70,6 +81,9 @@ class ProofCertificate:
                 "repo_id": self.repo_id,
             },
         }
+        if self.batch:
+            data["proof"]["batch"] = dict(self.batch)
+        return data
 
     def to_json(self, indent: int = 2) -> str:
         return json.dumps(self.to_dict(), indent=indent)
@@ -94,17 +108,69 @@ class ProofCertificate:
             signature=data["proof"]["signature"],
             public_key=data["proof"]["public_key"],
             repo_id=data["proof"].get("repo_id", ""),
+            batch=data["proof"].get("batch"),
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "ProofCertificate":
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: str | bytes) -> "ProofCertificate":
+        return cls.from_dict(orjson.loads(json_str))
 
     @classmethod
     def from_compact(cls, compact: str) -> "ProofCertificate":
         """Parse compact base64 encoded certificate."""
-        data = base64.urlsafe_b64decode(compact.encode()).decode()
-        return cls.from_json(data)
+        return cls.from_json(base64.urlsafe_b64decode(compact.encode()))
+
+
+def _merkle_leaf(data: str) -> bytes:
+    """Hash a signed payload into a Merkle leaf (0x00 domain prefix)."""
+    return blake3.blake3(b"\x00" + data.encode()).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    """Hash two children into their parent (0x01 domain prefix)."""
+    return blake3.blake3(b"\x01" + left + right).digest()
+
+
+def _merkle_levels(leaves: list[bytes]) -> list[list[bytes]]:
+    """
+    Build every level of the Merkle tree, leaves first.
+
+    An unpaired last node is promoted unchanged to the next level.
+    """
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def _merkle_siblings(levels: list[list[bytes]], index: int) -> list[str]:
+    """Inclusion path for a leaf: the sibling at each level that has one."""
+    siblings = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            siblings.append(level[sibling].hex())
+        index //= 2
+    return siblings
+
+
+def _merkle_root(leaf: bytes, index: int, size: int, siblings: list[str]) -> bytes:
+    """Recompute the root from a leaf and its inclusion path."""
+    node = leaf
+    path = iter(siblings)
+    while size > 1:
+        if index ^ 1 < size:
+            sibling = bytes.fromhex(next(path))
+            node = _merkle_node(sibling, node) if index % 2 else _merkle_node(node, sibling)
+        index //= 2
+        size = (size + 1) // 2
+    if next(path, None) is not None:
+        raise ValueError("Merkle path too long")
+    return node
 
 
 class ProofManager:
@@ -217,6 +283,35 @@ class ProofManager:
         except Exception:
             return False
 
+    @staticmethod
+    def _sign_payload(
+        version: str,
+        claim_hash: str,
+        claim_content: str,
+        claim_domain: str,
+        verification_hash: str,
+        consensus_value: float,
+        consensus_passed: bool,
+        validators: list[str],
+        timestamp: str,
+    ) -> str:
+        """Canonical JSON covered by a certificate's signature."""
+        return json.dumps(
+            {
+                "v": version,
+                "ch": claim_hash,
+                "cc": claim_content,
+                "cd": claim_domain,
+                "vh": verification_hash,
+                "cv": consensus_value,
+                "cp": consensus_passed,
+                "vs": validators,
+                "ts": timestamp,
+            },
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+
     def create_proof(
         self,
         claim_hash: str,
@@ -237,21 +332,16 @@ class ProofManager:
         if timestamp is None:
             timestamp = datetime.utcnow().isoformat() + "Z"
 
-        # Data to sign (canonical JSON)
-        sign_data = json.dumps(
-            {
-                "v": self.PROOF_VERSION,
-                "ch": claim_hash,
-                "cc": claim_content,
-                "cd": claim_domain,
-                "vh": verification_hash,
-                "cv": consensus_value,
-                "cp": consensus_passed,
-                "vs": validators,
-                "ts": timestamp,
-            },
-            separators=(",", ":"),
-            sort_keys=True,
+        sign_data = self._sign_payload(
+            self.PROOF_VERSION,
+            claim_hash,
+            claim_content,
+            claim_domain,
+            verification_hash,
+            consensus_value,
+            consensus_passed,
+            validators,
+            timestamp,
         )
 
         signature = self.sign(sign_data)
@@ -273,6 +363,56 @@ class ProofManager:
             repo_id=repo_id,
         )
 
+    def create_batch_proof(
+        self,
+        entries: list[dict[str, Any]],
+        timestamp: str | None = None,
+    ) -> list[ProofCertificate]:
+        """
+        Create certificates for many claims with a single signature.
+
+        Each entry takes the keyword arguments of create_proof. The signed
+        payloads become the leaves of a Merkle tree and only the root is
+        signed; every certificate carries its inclusion path.
+        """
+        if not entries:
+            return []
+        if not self._private_key:
+            self.load_keys()
+
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat() + "Z"
+
+        leaves = [
+            _merkle_leaf(self._sign_payload(self.PROOF_VERSION, timestamp=timestamp, **entry))
+            for entry in entries
+        ]
+        levels = _merkle_levels(leaves)
+        root = levels[-1][0].hex()
+
+        signature = self.sign(root)
+        public_key = self.get_public_key_b64()
+        repo_id = self.get_repo_id()
+
+        return [
+            ProofCertificate(
+                version=self.PROOF_VERSION,
+                timestamp=timestamp,
+                signature=signature,
+                public_key=public_key,
+                repo_id=repo_id,
+                batch={
+                    "leaf": leaf.hex(),
+                    "index": index,
+                    "size": len(leaves),
+                    "siblings": _merkle_siblings(levels, index),
+                    "root": root,
+                },
+                **entry,
+            )
+            for index, (entry, leaf) in enumerate(zip(entries, leaves))
+        ]
+
     def verify_proof(self, cert: ProofCertificate) -> tuple[bool, str]:
         """
         Verify a proof certificate.
@@ -281,22 +421,33 @@ class ProofManager:
             Tuple of (is_valid, message)
         """
         # Reconstruct signed data
-        sign_data = json.dumps(
-            {
-                "v": cert.version,
-                "ch": cert.claim_hash,
-                "cc": cert.claim_content,
-                "cd": cert.claim_domain,
-                "vh": cert.verification_hash,
-                "cv": cert.consensus_value,
-                "cp": cert.consensus_passed,
-                "vs": cert.validators,
-                "ts": cert.timestamp,
-            },
-            separators=(",", ":"),
-            sort_keys=True,
+        sign_data = self._sign_payload(
+            cert.version,
+            cert.claim_hash,
+            cert.claim_content,
+            cert.claim_domain,
+            cert.verification_hash,
+            cert.consensus_value,
+            cert.consensus_passed,
+            cert.validators,
+            cert.timestamp,
         )
 
+        if cert.kind == "batch":
+            # The signature covers the Merkle root; walk the inclusion path to it
+            try:
+                root = _merkle_root(
+                    _merkle_leaf(sign_data),
+                    cert.batch["index"],
+                    cert.batch["size"],
+                    cert.batch["siblings"],
+                ).hex()
+            except (KeyError, TypeError, ValueError, StopIteration):
+                return False, "Invalid Merkle path"
+            if root != cert.batch.get("root"):
+                return False, "Invalid Merkle path"
+            sign_data = root
+
         # Verify signature
         is_valid = self.verify_signature(sign_data, cert.signature, cert.public_key)
 
@@ -5,14 +5,20 @@ Similar a .git/, almacena todos los objetos y referencias.
 """
 
 import json
+import logging
+import os
+import re
 import shutil
+import sqlite3
 import zlib
 from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TypeVar
 
-from .hashing import hash_to_path, path_to_hash
+from .hashing import HASH_ALGORITHM, hash_to_path, path_to_hash
 from .objects import (
     Axiom,
     Claim,
@@ -27,6 +33,24 @@ from .objects import (
 
 T = TypeVar("T", bound=TruthObject)
 
+logger = logging.getLogger(__name__)
+
+
+class RepositoryFormatError(Exception):
+    """Error cuando el repositorio usa un formato que esta versión no puede leer."""
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """Claim resumido devuelto por search() y log()."""
+
+    hash: str
+    content: str
+    domain: str
+    consensus: float
+    status: str
+    timestamp: str = ""
+
 
 class TruthRepository:
     """
@@ -45,9 +69,16 @@ class TruthRepository:
     │   └── anchors/      # Referencias fijas
     ├── HEAD              # Perspectiva actual
     ├── index             # Staging area
+    ├── search.db         # Índice FTS5 de claims verificados (regenerable)
     └── config            # Configuración
     """
 
+    # 2.0.0: objetos direccionados por BLAKE3 (1.x usaba SHA-256)
+    FORMAT_VERSION = "2.0.0"
+
+    # Esquema de search.db; se guarda en PRAGMA user_version al terminar el relleno
+    SEARCH_INDEX_VERSION = 1
+
     OBJECT_PREFIXES = {
         ObjectType.AXIOM: "ax",
         ObjectType.CLAIM: "cl",
@@ -62,6 +93,7 @@ class TruthRepository:
         self.head_file = self.root / "HEAD"
         self.index_file = self.root / "index"
         self.config_file = self.root / "config"
+        self.search_file = self.root / "search.db"
 
     # === Initialization ===
 
@@ -92,7 +124,8 @@ class TruthRepository:
 
         # Crear config
         config = {
-            "version": "1.0.0",
+            "version": self.FORMAT_VERSION,
+            "hash_algorithm": HASH_ALGORITHM,
             "created_at": datetime.now().isoformat(),
             "consensus_threshold": 0.66,
             "default_verifiers": ["CLAUDE", "GPT", "GRAVITY"],
@@ -108,8 +141,44 @@ class TruthRepository:
         return True
 
     def is_initialized(self) -> bool:
-        """Verificar si el repositorio está inicializado."""
-        return self.root.exists() and self.objects_dir.exists()
+        """
+        Verificar si el repositorio está inicializado.
+
+        Raises:
+            RepositoryFormatError: Si el repositorio usa un formato incompatible
+        """
+        if not (self.root.exists() and self.objects_dir.exists()):
+            return False
+        self.check_format()
+        return True
+
+    def check_format(self):
+        """
+        Rechazar repositorios creados con otro formato de objetos.
+
+        Los repositorios 1.x direccionan los objetos por SHA-256; leerlos con
+        BLAKE3 daría "Hash mismatch" en cada objeto. Sin config no hay nada
+        que comprobar (repositorio inexistente o a medio crear).
+
+        Raises:
+            RepositoryFormatError: Si la versión mayor o el algoritmo de hash
+                no coinciden con los de esta versión
+        """
+        if not self.config_file.exists():
+            return
+        config = json.loads(self.config_file.read_text())
+        version = str(config.get("version", "1.0.0"))
+        algorithm = config.get("hash_algorithm", "sha256")
+        if (
+            version.split(".")[0] != self.FORMAT_VERSION.split(".")[0]
+            or algorithm != HASH_ALGORITHM
+        ):
+            raise RepositoryFormatError(
+                f"Repository at {self.root} uses format {version} ({algorithm} object "
+                f"hashes); this TruthGit reads format {self.FORMAT_VERSION} "
+                f"({HASH_ALGORITHM}). Open it with truthgit<=0.5.1, or re-create it with "
+                "`truthgit init --force` and re-add its claims."
+            )
 
     # === Object Storage ===
 
@@ -168,9 +237,148 @@ class TruthRepository:
         obj_path = self._object_path(obj_type, obj_hash)
         if obj_path.exists():
             obj_path.unlink()
+            if obj_type == ObjectType.CLAIM and self.search_file.exists():
+                with closing(self._search_connection()) as conn, conn:
+                    conn.execute(
+                        "DELETE FROM claims_fts WHERE rowid = ?", (self._search_rowid(obj_hash),)
+                    )
             return True
         return False
 
+    # === Search Index ===
+
+    @staticmethod
+    def _search_rowid(obj_hash: str) -> int:
+        """Rowid estable derivado del hash (60 bits, cabe en INTEGER de SQLite)."""
+        return int(obj_hash[:15], 16)
+
+    @staticmethod
+    def _claim_status(verification: Verification) -> str:
+        """Estado de los claims de una verificación."""
+        return "VERIFIED" if verification.consensus.passed else "DISPUTED"
+
+    def _index_verification(self, conn: sqlite3.Connection, verification: Verification):
+        """Insertar (o reemplazar) los claims de una verificación en el índice."""
+        context = self.load(ObjectType.CONTEXT, verification.context_hash)
+        if not context:
+            return
+        status = self._claim_status(verification)
+        for ref in context.claims:
+            claim = self.load(ObjectType.CLAIM, ref.hash)
+            if not claim:
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO claims_fts"
+                "(rowid, content, domain, hash, consensus, status, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._search_rowid(claim.hash),
+                    claim.content,
+                    claim.domain,
+                    claim.hash,
+                    verification.consensus.value,
+                    status,
+                    verification.timestamp,
+                ),
+            )
+
+    def _index_verification_best_effort(self, verification: Verification):
+        """
+        Indexar una verificación sin que un fallo del índice aborte el commit.
+
+        Si SQLite falla (p.ej. sin FTS5 o search.db bloqueado) se descarta
+        search.db, y la próxima apertura lo reconstruye desde los objetos.
+        """
+        try:
+            with closing(self._search_connection()) as conn, conn:
+                self._index_verification(conn, verification)
+        except sqlite3.Error as e:
+            logger.warning("Search index update failed, rebuilding on next open: %s", e)
+            try:
+                self.search_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _search_connection(self) -> sqlite3.Connection:
+        """
+        Abrir el índice FTS5 de claims verificados.
+
+        Si el índice falta o es de otra versión se reconstruye a partir de
+        las verificaciones existentes. PRAGMA user_version se escribe en la
+        misma transacción que el relleno, así que un relleno fallido no deja
+        un índice incompleto: se reintenta en la próxima apertura.
+        """
+        conn = sqlite3.connect(self.search_file)
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SEARCH_INDEX_VERSION:
+                self._rebuild_search_index(conn)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _rebuild_search_index(self, conn: sqlite3.Connection):
+        """Reconstruir el índice de búsqueda en una sola transacción."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Otro proceso pudo reconstruirlo mientras esperábamos el lock
+            if conn.execute("PRAGMA user_version").fetchone()[0] == self.SEARCH_INDEX_VERSION:
+                conn.rollback()
+                return
+            conn.execute("DROP TABLE IF EXISTS claims_fts")
+            conn.execute(
+                "CREATE VIRTUAL TABLE claims_fts USING fts5(content, domain UNINDEXED, "
+                "hash UNINDEXED, consensus UNINDEXED, status UNINDEXED, timestamp UNINDEXED)"
+            )
+            # En orden cronológico: la última verificación de cada claim prevalece
+            verifications = sorted(
+                self.iter_objects(ObjectType.VERIFICATION), key=lambda v: v.timestamp
+            )
+            for verification in verifications:
+                self._index_verification(conn, verification)
+            conn.execute(f"PRAGMA user_version = {self.SEARCH_INDEX_VERSION}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def ensure_search_index(self):
+        """Crear el índice de búsqueda si falta (p.ej. al arrancar el servidor)."""
+        self._search_connection().close()
+
+    def search(self, query: str, domain: str | None = None, limit: int = 10) -> list[SearchHit]:
+        """
+        Buscar claims por texto completo.
+
+        Solo se indexan claims ya verificados, con el consenso y estado de
+        su última verificación. Cada palabra de la consulta debe aparecer en
+        el claim; los resultados se ordenan por relevancia (BM25) y se
+        sirven desde el índice sin cargar los objetos.
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"' for term in terms)
+
+        with closing(self._search_connection()) as conn:
+            rows = conn.execute(
+                "SELECT hash, content, domain, consensus, status, timestamp FROM claims_fts "
+                "WHERE claims_fts MATCH ? AND (? IS NULL OR domain = ?) ORDER BY rank LIMIT ?",
+                (match, domain, domain, limit),
+            ).fetchall()
+
+        return [
+            SearchHit(
+                hash=claim_hash,
+                content=content,
+                domain=claim_domain,
+                consensus=consensus,
+                status=status,
+                timestamp=timestamp,
+            )
+            for claim_hash, content, claim_domain, consensus, status, timestamp in rows
+        ]
+
     # === Index (Staging Area) ===
 
     def _read_index(self) -> dict:
@@ -454,6 +662,9 @@ class TruthRepository:
         )
         verification_hash = self.store(verification)
 
+        # Indexar los claims ahora que tienen veredicto
+        self._index_verification_best_effort(verification)
+
         # Actualizar referencias
         for verifier in verifiers:
             self.set_ref(f"perspectives/{verifier}", verification_hash)
@@ -506,6 +717,38 @@ class TruthRepository:
 
         return history
 
+    def log(self, limit: int = 10) -> list[SearchHit]:
+        """
+        Claims de las verificaciones más recientes.
+
+        Returns:
+            Lista de SearchHit con el consenso y timestamp de su verificación
+        """
+        entries = []
+        for verification in self.history(limit=limit):
+            context = self.load(ObjectType.CONTEXT, verification.context_hash)
+            if not context:
+                continue
+
+            for ref in context.claims:
+                claim = self.load(ObjectType.CLAIM, ref.hash)
+                if not claim:
+                    continue
+                entries.append(
+                    SearchHit(
+                        hash=claim.hash,
+                        content=claim.content,
+                        domain=claim.domain,
+                        consensus=verification.consensus.value,
+                        status=self._claim_status(verification),
+                        timestamp=verification.timestamp,
+                    )
+                )
+                if len(entries) >= limit:
+                    return entries
+
+        return entries
+
     def status(self) -> dict:
         """
         Obtener estado del repositorio.
@@ -553,7 +796,7 @@ class TruthRepository:
     def count_objects(self) -> dict[str, int]:
         """Contar objetos por tipo."""
         counts = {}
-        for obj_type in ObjectType:
+        for obj_type in self.OBJECT_PREFIXES:
             count = sum(1 for _ in self.iter_objects(obj_type))
             counts[obj_type.value] = count
         return counts
@@ -569,36 +812,50 @@ class TruthRepository:
             return data
         return None
 
-    def get_object_by_prefix(self, prefix: str) -> tuple[ObjectType, dict] | None:
+    def find_object_by_prefix(self, prefix: str) -> tuple[ObjectType, str] | None:
         """
-        Find object by hash prefix (like git).
+        Find an object hash by prefix using directory listings only.
+
+        Object filenames are their hashes, so no object is read from disk.
 
         Returns:
-            Tuple of (object_type, object_data) or None
+            Tuple of (object_type, full_hash) or None
         """
         prefix = prefix.lower()
+        dir_prefix, file_prefix = prefix[:2], prefix[2:]
 
-        for obj_type in ObjectType:
-            type_prefix = self.OBJECT_PREFIXES[obj_type]
+        for obj_type, type_prefix in self.OBJECT_PREFIXES.items():
             type_dir = self.objects_dir / type_prefix
-
             if not type_dir.exists():
                 continue
 
-            # Check each subdirectory
-            for dir_entry in type_dir.iterdir():
-                if not dir_entry.is_dir():
-                    continue
+            with os.scandir(type_dir) as dirs:
+                for dir_entry in dirs:
+                    if not dir_entry.name.startswith(dir_prefix) or not dir_entry.is_dir():
+                        continue
 
-                for file_entry in dir_entry.iterdir():
-                    obj_hash = path_to_hash(dir_entry.name, file_entry.name)
-                    if obj_hash.startswith(prefix):
-                        obj = self.get_object(obj_type, obj_hash)
-                        if obj:
-                            return (obj_type, obj)
+                    with os.scandir(dir_entry.path) as files:
+                        for file_entry in files:
+                            if file_entry.name.startswith(file_prefix):
+                                return obj_type, path_to_hash(dir_entry.name, file_entry.name)
 
         return None
 
+    def get_object_by_prefix(self, prefix: str) -> tuple[ObjectType, dict] | None:
+        """
+        Find object by hash prefix (like git).
+
+        Returns:
+            Tuple of (object_type, object_data) or None
+        """
+        found = self.find_object_by_prefix(prefix)
+        if not found:
+            return None
+
+        obj_type, obj_hash = found
+        obj = self.get_object(obj_type, obj_hash)
+        return (obj_type, obj) if obj else None
+
     def find_verifications_for_claim(self, claim_hash: str) -> list[dict]:
         """
         Find all verifications that include a specific claim.
@@ -18,7 +18,6 @@ Usage:
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import time
@@ -30,6 +29,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .extractor import KnowledgeExtractor
+from .hashing import file_hash
 
 if TYPE_CHECKING:
     from .objects import Claim
@@ -226,8 +226,7 @@ class DocumentSync:
 
     def _file_hash(self, path: Path) -> str:
         """Calculate hash of file contents."""
-        content = path.read_bytes()
-        return hashlib.sha256(content).hexdigest()
+        return file_hash(path)
 
     def _should_ignore(self, path: Path, ignore_patterns: list[str]) -> bool:
         """Check if path should be ignored."""
@@ -18,13 +18,198 @@ Usage:
     validators = [OllamaValidator("llama3"), ClaudeValidator()]
 """
 
-import json
+import asyncio
+import atexit
+import functools
 import os
+import random
+import re
+import shlex
+import string
+import subprocess
+import tempfile
+import threading
+import time
+import warnings
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from importlib.util import find_spec
 
+import orjson
 
-@dataclass
+from .cache import cached_validation
+
+# Bump whenever a validator prompt changes; invalidates cached verdicts.
+PROMPT_VERSION = "v1"
+
+# Shared HTTP client: pooled keep-alive connections for every validator
+# that talks HTTP directly or through an SDK that accepts an httpx client.
+_HTTP = None
+_HTTP_LOCK = threading.Lock()
+
+
+def _get_http_client():
+    """Return the process-wide httpx.Client, creating it on first use."""
+    global _HTTP
+    if _HTTP is None:
+        import httpx
+
+        with _HTTP_LOCK:
+            if _HTTP is None:
+                _HTTP = httpx.Client(
+                    http2=find_spec("h2") is not None,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=32),
+                )
+    return _HTTP
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client (it is recreated on next use)."""
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is not None:
+            _HTTP.close()
+            _HTTP = None
+
+
+atexit.register(close_http_client)
+
+# Optional SDKs: availability is probed without importing them, so loading
+# this module stays cheap; each validator imports its SDK once, on first use.
+_HAS_ANTHROPIC = find_spec("anthropic") is not None
+_HAS_OPENAI = find_spec("openai") is not None
+
+# Async counterpart for avalidate(). Pooled connections belong to the event
+# loop that opened them, so there is one client per running loop.
+_ASYNC_HTTP: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_http():
+    """Return the httpx.AsyncClient shared by validators on the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP.get(loop)
+    if client is None or client.is_closed:
+        import httpx
+
+        client = httpx.AsyncClient(
+            http2=find_spec("h2") is not None,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=512, max_keepalive_connections=256),
+        )
+        _ASYNC_HTTP[loop] = client
+    return client
+
+
+# Ollama fans many small requests out to one local server, where aiohttp
+# holds up under concurrency far better than httpx.AsyncClient. Optional:
+# without it Ollama uses the shared AsyncClient like everything else.
+_HAS_AIOHTTP = find_spec("aiohttp") is not None
+_AIOHTTP_SESSIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_aiohttp_session():
+    """Return the aiohttp.ClientSession shared on the running loop."""
+    loop = asyncio.get_running_loop()
+    session = _AIOHTTP_SESSIONS.get(loop)
+    if session is None or session.closed:
+        import aiohttp
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=256, limit_per_host=128, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=60),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
+        _AIOHTTP_SESSIONS[loop] = session
+    return session
+
+
+async def aclose_http() -> None:
+    """Close the running loop's shared async HTTP clients, if any were created."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    session = _AIOHTTP_SESSIONS.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+# Per-provider request budgets (requests, seconds) for avalidate(), sized to
+# the default API tiers so large fan-outs queue locally instead of hitting 429s.
+_RATE_LIMITS = {"CLAUDE": (50, 60), "GPT": (500, 60), "GEMINI": (60, 60), "OLLAMA": (16, 1)}
+_MAX_CONCURRENCY = 16
+
+# 429 retries: decorrelated jitter between _RETRY_MIN and _RETRY_MAX seconds
+_RETRY_ATTEMPTS = 4
+_RETRY_MIN = 1.0
+_RETRY_MAX = 30.0
+
+
+class TokenBucket:
+    """Async token bucket: up to `rate` acquisitions per `per` seconds."""
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / per
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+
+class ValidationTimeoutError(Exception):
+    """A provider call outlived its validator's timeout."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Timed out after {timeout:g}s")
+
+
+@dataclass(slots=True)
+class _ProviderLimit:
+    semaphore: asyncio.Semaphore
+    bucket: TokenBucket | None
+
+
+# Like the AsyncClient, semaphores belong to one event loop: loop -> {provider: limit}
+_PROVIDER_LIMITS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _provider_limit(provider: str, key: str, concurrency: int) -> _ProviderLimit:
+    limits = _PROVIDER_LIMITS.setdefault(asyncio.get_running_loop(), {})
+    limit = limits.get(key)
+    if limit is None:
+        rate = _RATE_LIMITS.get(provider)
+        limit = limits[key] = _ProviderLimit(
+            asyncio.Semaphore(concurrency), TokenBucket(*rate) if rate else None
+        )
+    return limit
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an SDK or httpx exception is an HTTP 429."""
+    response = getattr(error, "response", None)
+    return 429 in (
+        getattr(error, "status_code", None),
+        getattr(error, "status", None),
+        getattr(error, "code", None),
+        getattr(response, "status_code", None),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result from a single validator."""
 
@@ -40,9 +225,54 @@ class ValidationResult:
         return self.error is None
 
 
+def _precompile(template: str, fields=("claim", "domain")) -> tuple[str, ...]:
+    """
+    Split a str.format template into the literal parts around its fields.
+
+    Rendering becomes a join of the parts with the field values, so hot
+    paths skip re-parsing the template on every call.
+    """
+    parts = [""]
+    names = []
+    for literal, name, _spec, _conv in string.Formatter().parse(template):
+        parts[-1] += literal
+        if name is not None:
+            names.append(name)
+            parts.append("")
+    if tuple(names) != tuple(fields):
+        raise ValueError(f"Template fields {names} do not match {list(fields)}")
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_prompt(parts: tuple[str, ...], claim: str, domain: str) -> str:
+    """Join precompiled prompt parts; repeated claims (e.g. batches) hit the cache."""
+    prefix, mid, suffix = parts
+    return "".join((prefix, claim, mid, domain, suffix))
+
+
+# Prompt shared by the Claude, GPT, Gemini and Hugging Face validators
+CLOUD_PROMPT = """Analyze this claim for accuracy. Respond with JSON only:
+{{"confidence": <0-1>, "reasoning": "<brief explanation>"}}
+
+Claim: {claim}
+Domain: {domain}"""
+
+_CLOUD_PROMPT_PARTS = _precompile(CLOUD_PROMPT)
+
+
 class Validator(ABC):
     """Base class for all validators."""
 
+    PROMPT_VERSION = PROMPT_VERSION
+
+    # Seconds each provider call may take in avalidate() (None: no limit)
+    timeout: float | None = 120.0
+
+    # Asks a person; validate_claims() sends it every claim in one
+    # validate_batch() call so prompts for different claims never interleave
+    interactive: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -63,16 +293,243 @@ class Validator(ABC):
         """
         pass
 
+    async def _ais_available(self) -> bool:
+        """is_available() in a worker thread, so probes can run concurrently."""
+        return await asyncio.to_thread(self.is_available)
+
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        """
+        Async variant of validate().
+
+        Network validators override this with a native async client; the
+        default runs validate() in a worker thread so it never blocks the loop.
+        """
+        return await self._timed(lambda: asyncio.to_thread(self.validate, claim, domain))
+
+    def validate_batch(self, claims: list[tuple[str, str]]) -> list[ValidationResult]:
+        """
+        Validate many (claim, domain) pairs, results in input order.
+
+        Providers with a batch API override this; the default validates
+        one claim at a time.
+        """
+        return [self.validate(claim, domain) for claim, domain in claims]
+
     def is_available(self) -> bool:
         """Check if this validator is available (e.g., API key set)."""
         return True
 
+    @property
+    def cache_tag(self) -> str:
+        """Model/variant part of the response-cache key."""
+        return getattr(self, "model", "")
+
+    def _identity(self) -> tuple:
+        return (type(self), self.name, self.cache_tag)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Validator):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    def __hash__(self) -> int:
+        return hash(self._identity())
+
+    @property
+    def provider(self) -> str:
+        """Rate-limit bucket shared by validators of the same provider."""
+        return self.name.split(":")[0]
+
+    @property
+    def limit_key(self) -> str:
+        """Validators with the same key share one semaphore and token bucket."""
+        return self.provider
+
+    @property
+    def concurrency(self) -> int:
+        """Requests that may be in flight at once for limit_key."""
+        return _MAX_CONCURRENCY
+
+    async def _timed(self, call):
+        """
+        Await call() bounded by self.timeout (None: no limit).
+
+        Exceptions from call() are captured inside the timed coroutine, so
+        only the expired timeout raises ValidationTimeoutError, even when call()
+        raises a TimeoutError of its own.
+        """
+        if self.timeout is None:
+            return await call()
+
+        async def guarded():
+            try:
+                return await call(), None
+            except Exception as e:
+                return None, e
+
+        try:
+            result, error = await asyncio.wait_for(guarded(), self.timeout)
+        except asyncio.TimeoutError:
+            raise ValidationTimeoutError(self.timeout) from None
+        if error is not None:
+            raise error
+        return result
+
+    async def _limited(self, call):
+        """
+        Await call() within the provider's concurrency and rate limits.
+
+        Only the call itself is bounded by self.timeout, not the time spent
+        waiting for the semaphore or a token, so large fan-outs queue instead
+        of timing out. Rate-limited (429) calls are retried with decorrelated
+        jitter.
+        """
+        limit = _provider_limit(self.provider, self.limit_key, self.concurrency)
+        delay = _RETRY_MIN
+        for attempt in range(_RETRY_ATTEMPTS):
+            async with limit.semaphore:
+                if limit.bucket is not None:
+                    await limit.bucket.acquire()
+                try:
+                    return await self._timed(call)
+                except Exception as e:
+                    if attempt == _RETRY_ATTEMPTS - 1 or not _is_rate_limited(e):
+                        raise
+            delay = min(_RETRY_MAX, random.uniform(_RETRY_MIN, delay * 3))
+            await asyncio.sleep(delay)
+
+    def _prompt(self, claim: str, domain: str) -> str:
+        """Render the precompiled prompt for a claim."""
+        return _render_prompt(self._PROMPT_PARTS, claim, domain)
+
+    def _failure(self, error: str) -> ValidationResult:
+        """Result for a validator that could not produce a verdict."""
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=0,
+            reasoning="",
+            error=error,
+        )
+
 
 # =============================================================================
 # LOCAL VALIDATORS (No API keys required)
 # =============================================================================
 
 
+OLLAMA_DEFAULT_URL = "http://localhost:11434"
+
+
+def ollama_base_url() -> str:
+    """Ollama server for every local call: $OLLAMA_BASE_URL or localhost."""
+    return os.getenv("OLLAMA_BASE_URL", OLLAMA_DEFAULT_URL).rstrip("/")
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Positive integer from the environment; invalid values warn and use default."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        warnings.warn(
+            f"{name}={raw!r} is not a positive integer; using {default}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return default
+    return value
+
+
+# Ollama /api/tags probes: url -> (monotonic time, installed model names).
+# get_default_validators() probes several times in a row; one request serves them all.
+_AVAILABILITY_CACHE: dict[str, tuple[float, list[str]]] = {}
+_AVAILABILITY_TTL = 30.0
+
+
+def _ollama_tags(url: str) -> list[str]:
+    """Installed Ollama model names (e.g. "llama3:latest"), [] if unreachable."""
+    now = time.monotonic()
+    checked, names = _AVAILABILITY_CACHE.get(url, (0.0, []))
+    if checked and now - checked < _AVAILABILITY_TTL:
+        return names
+
+    try:
+        response = _get_http_client().get(url, timeout=1.0)
+        names = []
+        if response.status_code == 200:
+            names = [m.get("name", "") for m in orjson.loads(response.content).get("models", [])]
+    except Exception:
+        names = []
+    _AVAILABILITY_CACHE[url] = (now, names)
+    return names
+
+
+_PARALLELISM_CHECKED: set[str] = set()
+
+
+def _check_ollama_parallelism(base_url: str, concurrency: int) -> None:
+    """
+    Warn (once per server) when client concurrency exceeds what Ollama serves.
+
+    Requests beyond OLLAMA_NUM_PARALLEL per loaded model queue on the server,
+    so extra client concurrency buys nothing. /api/ps lists loaded models;
+    OLLAMA_NUM_PARALLEL is read from this process's environment, and only
+    checked when set there (Ollama picks its own default otherwise).
+    """
+    if base_url in _PARALLELISM_CHECKED or os.getenv("OLLAMA_NUM_PARALLEL") is None:
+        return
+    _PARALLELISM_CHECKED.add(base_url)
+    try:
+        response = _get_http_client().get(f"{base_url}/api/ps", timeout=1.0)
+        loaded = len(orjson.loads(response.content).get("models", []))
+    except Exception:
+        return
+
+    num_parallel = _env_positive_int("OLLAMA_NUM_PARALLEL", 1)
+    if num_parallel * max(loaded, 1) < concurrency:
+        warnings.warn(
+            f"OLLAMA_CLIENT_CONCURRENCY={concurrency} exceeds what {base_url} serves "
+            f"in parallel (OLLAMA_NUM_PARALLEL={num_parallel} x {loaded} loaded models); "
+            "extra requests will queue on the server",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+_CONF_RE = re.compile(r'"confidence"\s*:\s*"?([0-9]*\.?[0-9]+)')
+# Same, but only once the number is complete (followed by a delimiter)
+_CONF_DONE_RE = re.compile(r'"confidence"\s*:\s*"?([0-9]*\.?[0-9]+)\s*[,}"]')
+
+
+class _ConfidenceScanner:
+    """
+    Incremental reader of a streamed /api/generate response.
+
+    feed() returns True once the confidence is known (or the stream is
+    done), so the caller can close the connection and let Ollama stop
+    generating the rest of the answer.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.confidence: float | None = None
+
+    def feed(self, line: bytes | str) -> bool:
+        if not line.strip():
+            return False
+        chunk = orjson.loads(line)
+        self.text += chunk.get("response", "")
+        match = _CONF_DONE_RE.search(self.text)
+        if match:
+            self.confidence = float(match.group(1))
+            return True
+        return bool(chunk.get("done"))
+
+
 class OllamaValidator(Validator):
     """
     Validator using Ollama for local LLM inference.
@@ -95,84 +552,171 @@ Respond in JSON format:
 
 Be objective. If uncertain, reflect that in a lower confidence score."""
 
-    def __init__(self, model: str = "llama3"):
+    _PROMPT_PARTS = _precompile(PROMPT_TEMPLATE)
+
+    def __init__(
+        self, model: str = "llama3", score_only: bool = False, base_url: str | None = None
+    ):
+        """
+        Args:
+            model: Ollama model name
+            score_only: Stream the answer and stop generating as soon as the
+                confidence is known; results carry no reasoning.
+            base_url: Ollama server (default: $OLLAMA_BASE_URL or localhost)
+
+        OLLAMA_CLIENT_CONCURRENCY (default 8) caps in-flight requests per
+        server; keep it in line with the server's OLLAMA_NUM_PARALLEL.
+        """
         self.model = model
+        self.score_only = score_only
+        self.base_url = (base_url or ollama_base_url()).rstrip("/")
+        self.generate_url = f"{self.base_url}/api/generate"
+        self.tags_url = f"{self.base_url}/api/tags"
+        self._concurrency = _env_positive_int("OLLAMA_CLIENT_CONCURRENCY", 8)
         self._name = f"OLLAMA:{model.upper()}"
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def limit_key(self) -> str:
+        return f"OLLAMA {self.base_url}"
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
     def is_available(self) -> bool:
         """Check if Ollama is running and this specific model exists."""
-        try:
-            import httpx
+        full_names = _ollama_tags(self.tags_url)
+        model_names = [name.split(":")[0] for name in full_names]
+        available = self.model in model_names or f"{self.model}:latest" in full_names
+        if available:
+            _check_ollama_parallelism(self.base_url, self._concurrency)
+        return available
 
-            response = httpx.get("http://localhost:11434/api/tags", timeout=2)
-            if response.status_code != 200:
-                return False
+    @property
+    def cache_tag(self) -> str:
+        # Different servers may serve different builds under one model name
+        tag = f"{self.base_url}/{self.model}"
+        return f"{tag}:score-only" if self.score_only else tag
+
+    def _request(self, claim: str, domain: str) -> dict:
+        return {
+            "model": self.model,
+            "prompt": self._prompt(claim, domain),
+            "stream": self.score_only,
+            "format": "json",
+        }
+
+    def _parse(self, body: bytes) -> ValidationResult:
+        """Parse a raw /api/generate response body."""
+        return self._verdict(orjson.loads(body).get("response") or "{}")
+
+    def _scanned(self, scanner: _ConfidenceScanner) -> ValidationResult:
+        """Result of a score-only stream."""
+        if scanner.confidence is None:
+            # Stream ended without a well-formed confidence: parse what we got
+            return self._verdict(scanner.text or "{}")
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=min(1.0, max(0.0, scanner.confidence)),
+            reasoning="",
+            model=self.model,
+        )
 
-            # Check if our specific model is available
-            data = response.json()
-            models = data.get("models", [])
-            model_names = [m.get("name", "").split(":")[0] for m in models]
-            full_names = [m.get("name", "") for m in models]
-            return self.model in model_names or f"{self.model}:latest" in full_names
-        except Exception:
-            return False
+    def _verdict(self, text: str) -> ValidationResult:
+        """Parse the model's JSON verdict."""
+        # Parse JSON response
+        try:
+            parsed = orjson.loads(text)
+            confidence = float(parsed.get("confidence", 0.5))
+            reasoning = parsed.get("reasoning", "No reasoning provided")
+        except orjson.JSONDecodeError:
+            # Fallback: pluck the confidence from malformed output
+            match = _CONF_RE.search(text)
+            confidence = float(match.group(1)) if match else 0.5
+            reasoning = text[:200] if text else "Could not parse response"
+
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=min(1.0, max(0.0, confidence)),
+            reasoning=reasoning,
+            model=self.model,
+        )
 
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         try:
-            import httpx
-
-            prompt = self.PROMPT_TEMPLATE.format(claim=claim, domain=domain)
-
-            response = httpx.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "format": "json",
-                },
+            if self.score_only:
+                scanner = _ConfidenceScanner()
+                with _get_http_client().stream(
+                    "POST", self.generate_url, json=self._request(claim, domain), timeout=60
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if scanner.feed(line):
+                            break
+                return self._scanned(scanner)
+
+            response = _get_http_client().post(
+                self.generate_url,
+                json=self._request(claim, domain),
                 timeout=60,
             )
             response.raise_for_status()
+            return self._parse(response.content)
 
-            result = response.json()
-            text = result.get("response", "{}")
+        except ImportError:
+            return self._failure("httpx not installed. Run: pip install httpx")
+        except Exception as e:
+            return self._failure(str(e))
 
-            # Parse JSON response
-            try:
-                parsed = json.loads(text)
-                confidence = float(parsed.get("confidence", 0.5))
-                reasoning = parsed.get("reasoning", "No reasoning provided")
-            except json.JSONDecodeError:
-                # Fallback: try to extract from text
-                confidence = 0.5
-                reasoning = text[:200] if text else "Could not parse response"
+    @cached_validation
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        try:
 
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=min(1.0, max(0.0, confidence)),
-                reasoning=reasoning,
-                model=self.model,
-            )
+            async def generate() -> bytes:
+                if _HAS_AIOHTTP:
+                    session = _get_aiohttp_session()
+                    async with session.post(self.generate_url, json=body) as response:
+                        response.raise_for_status()
+                        return await response.read()
+
+                response = await _get_http().post(self.generate_url, json=body)
+                response.raise_for_status()
+                return response.content
+
+            async def stream() -> _ConfidenceScanner:
+                # Leaving the context mid-stream drops the connection, which
+                # makes Ollama stop generating
+                scanner = _ConfidenceScanner()
+                if _HAS_AIOHTTP:
+                    session = _get_aiohttp_session()
+                    async with session.post(self.generate_url, json=body) as response:
+                        response.raise_for_status()
+                        async for line in response.content:
+                            if scanner.feed(line):
+                                break
+                    return scanner
+
+                async with _get_http().stream("POST", self.generate_url, json=body) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if scanner.feed(line):
+                            break
+                return scanner
+
+            body = self._request(claim, domain)
+            if self.score_only:
+                return self._scanned(await self._limited(stream))
+            return self._parse(await self._limited(generate))
 
         except ImportError:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="httpx not installed. Run: pip install httpx",
-            )
+            return self._failure("httpx not installed. Run: pip install httpx")
         except Exception as e:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error=str(e),
-            )
+            return self._failure(str(e))
 
 
 # =============================================================================
@@ -180,18 +724,33 @@ Be objective. If uncertain, reflect that in a lower confidence score."""
 # =============================================================================
 
 
+def _wait_for_batch(retrieve, is_done, timeout: float = 24 * 3600, max_delay: float = 60.0):
+    """Poll a provider batch job with exponential backoff until it finishes."""
+    deadline = time.monotonic() + timeout
+    delay = 2.0
+    while True:
+        job = retrieve()
+        if is_done(job):
+            return job
+        if time.monotonic() >= deadline:
+            raise TimeoutError("Batch job did not finish in time")
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
 class ClaudeValidator(Validator):
     """Validator using Anthropic's Claude API."""
 
-    PROMPT = """Analyze this claim for accuracy. Respond with JSON only:
-{{"confidence": <0-1>, "reasoning": "<brief explanation>"}}
-
-Claim: {claim}
-Domain: {domain}"""
+    PROMPT = CLOUD_PROMPT
+    _PROMPT_PARTS = _CLOUD_PROMPT_PARTS
 
     def __init__(self, model: str = "claude-3-haiku-20240307"):
         self.model = model
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self._client = None
+        self._client_http = None
+        self._async_client = None
+        self._async_client_http = None
 
     @property
     def name(self) -> str:
@@ -200,95 +759,158 @@ Domain: {domain}"""
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def _request(self, claim: str, domain: str) -> dict:
+        return {
+            "model": self.model,
+            "max_tokens": 256,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self._prompt(claim, domain),
+                }
+            ],
+        }
+
+    def _parse(self, response) -> ValidationResult:
+        text = response.content[0].text
+
+        # Parse JSON response with robust error handling
+        parsed = {}
+        try:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Try to extract JSON from text using regex
+            # Match JSON-like structure (handles simple cases)
+            json_match = re.search(r'\{[^{}]*"confidence"[^{}]*\}', text, re.DOTALL)
+            if json_match:
+                try:
+                    parsed = orjson.loads(json_match.group())
+                except orjson.JSONDecodeError:
+                    pass  # Keep parsed as empty dict
+
+        # Safely extract values with defaults
+        confidence = 0.5
+        reasoning = text[:200] if text else "No reasoning"
+        try:
+            if "confidence" in parsed:
+                confidence = float(parsed["confidence"])
+            if "reasoning" in parsed:
+                reasoning = str(parsed["reasoning"])
+        except (ValueError, TypeError):
+            pass  # Keep defaults
+
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=min(1.0, max(0.0, confidence)),
+            reasoning=reasoning,
+            model=self.model,
+            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+        )
+
+    def _ensure_client(self):
+        """Anthropic client, rebuilt only when the shared HTTP client changes."""
+        http = _get_http_client()
+        if self._client_http is not http:
+            import anthropic
+
+            self._client = anthropic.Anthropic(api_key=self.api_key, http_client=http)
+            self._client_http = http
+        return self._client
+
+    def _ensure_async_client(self):
+        """AsyncAnthropic client bound to the running loop's shared HTTP client."""
+        http = _get_http()
+        if self._async_client_http is not http:
+            import anthropic
+
+            self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http)
+            self._async_client_http = http
+        return self._async_client
+
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         if not self.api_key:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="ANTHROPIC_API_KEY not set",
-            )
+            return self._failure("ANTHROPIC_API_KEY not set")
+        if not _HAS_ANTHROPIC:
+            return self._failure("anthropic not installed. Run: pip install anthropic")
 
         try:
-            import anthropic
+            client = self._ensure_client()
+            return self._parse(client.messages.create(**self._request(claim, domain)))
+        except Exception as e:
+            return self._failure(str(e))
 
-            client = anthropic.Anthropic(api_key=self.api_key)
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=256,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": self.PROMPT.format(claim=claim, domain=domain),
-                    }
-                ],
+    def validate_batch(self, claims: list[tuple[str, str]]) -> list[ValidationResult]:
+        """
+        Validate many claims through the Message Batches API.
+
+        Half the cost of individual calls; results may take up to 24 hours.
+        """
+        if not claims:
+            return []
+        if not self.api_key:
+            return [self._failure("ANTHROPIC_API_KEY not set")] * len(claims)
+        if not _HAS_ANTHROPIC:
+            return [self._failure("anthropic not installed. Run: pip install anthropic")] * len(
+                claims
             )
 
-            text = response.content[0].text
+        try:
+            client = self._ensure_client()
+            job = client.messages.batches.create(
+                requests=[
+                    {"custom_id": str(i), "params": self._request(claim, domain)}
+                    for i, (claim, domain) in enumerate(claims)
+                ]
+            )
+            _wait_for_batch(
+                lambda: client.messages.batches.retrieve(job.id),
+                lambda j: j.processing_status == "ended",
+            )
 
-            # Parse JSON response with robust error handling
-            parsed = {}
-            try:
-                parsed = json.loads(text)
-            except json.JSONDecodeError:
-                # Try to extract JSON from text using regex
-                import re
+            results = {}
+            for entry in client.messages.batches.results(job.id):
+                if entry.result.type == "succeeded":
+                    results[entry.custom_id] = self._parse(entry.result.message)
+                else:
+                    error = getattr(entry.result, "error", None) or entry.result.type
+                    results[entry.custom_id] = self._failure(f"Batch request failed: {error}")
 
-                # Match JSON-like structure (handles simple cases)
-                json_match = re.search(r'\{[^{}]*"confidence"[^{}]*\}', text, re.DOTALL)
-                if json_match:
-                    try:
-                        parsed = json.loads(json_match.group())
-                    except json.JSONDecodeError:
-                        pass  # Keep parsed as empty dict
-
-            # Safely extract values with defaults
-            confidence = 0.5
-            reasoning = text[:200] if text else "No reasoning"
-            try:
-                if "confidence" in parsed:
-                    confidence = float(parsed["confidence"])
-                if "reasoning" in parsed:
-                    reasoning = str(parsed["reasoning"])
-            except (ValueError, TypeError):
-                pass  # Keep defaults
+            return [
+                results.get(str(i), self._failure("Batch returned no result"))
+                for i in range(len(claims))
+            ]
+        except Exception as e:
+            return [self._failure(str(e))] * len(claims)
 
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=min(1.0, max(0.0, confidence)),
-                reasoning=reasoning,
-                model=self.model,
-                tokens_used=response.usage.input_tokens + response.usage.output_tokens,
-            )
+    @cached_validation
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        if not self.api_key:
+            return self._failure("ANTHROPIC_API_KEY not set")
+        if not _HAS_ANTHROPIC:
+            return self._failure("anthropic not installed. Run: pip install anthropic")
 
-        except ImportError:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="anthropic not installed. Run: pip install anthropic",
-            )
+        try:
+            client = self._ensure_async_client()
+            request = self._request(claim, domain)
+            return self._parse(await self._limited(lambda: client.messages.create(**request)))
         except Exception as e:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error=str(e),
-            )
+            return self._failure(str(e))
 
 
 class GPTValidator(Validator):
     """Validator using OpenAI's GPT API."""
 
-    PROMPT = """Analyze this claim for accuracy. Respond with JSON only:
-{{"confidence": <0-1>, "reasoning": "<brief explanation>"}}
-
-Claim: {claim}
-Domain: {domain}"""
+    PROMPT = CLOUD_PROMPT
+    _PROMPT_PARTS = _CLOUD_PROMPT_PARTS
 
     def __init__(self, model: str = "gpt-4o-mini"):
         self.model = model
         self.api_key = os.getenv("OPENAI_API_KEY")
+        self._client = None
+        self._client_http = None
+        self._async_client = None
+        self._async_client_http = None
 
     @property
     def name(self) -> str:
@@ -297,70 +919,161 @@ Domain: {domain}"""
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def _request(self, claim: str, domain: str) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self._prompt(claim, domain),
+                }
+            ],
+            "max_tokens": 256,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _result(self, text: str, tokens_used: int) -> ValidationResult:
+        parsed = orjson.loads(text)
+
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=float(parsed["confidence"]),
+            reasoning=parsed["reasoning"],
+            model=self.model,
+            tokens_used=tokens_used,
+        )
+
+    def _parse(self, response) -> ValidationResult:
+        return self._result(response.choices[0].message.content, response.usage.total_tokens)
+
+    def _parse_batch_line(self, entry: dict) -> ValidationResult:
+        """One line of a Batch API output or error file."""
+        response = entry.get("response") or {}
+        body = response.get("body") or {}
+        if entry.get("error") or response.get("status_code") != 200:
+            error = entry.get("error") or body.get("error") or "request failed"
+            return self._failure(f"Batch request failed: {error}")
+        try:
+            return self._result(
+                body["choices"][0]["message"]["content"], body["usage"]["total_tokens"]
+            )
+        except Exception as e:
+            return self._failure(str(e))
+
+    def _ensure_client(self):
+        """OpenAI client, rebuilt only when the shared HTTP client changes."""
+        http = _get_http_client()
+        if self._client_http is not http:
+            import openai
+
+            self._client = openai.OpenAI(api_key=self.api_key, http_client=http)
+            self._client_http = http
+        return self._client
+
+    def _ensure_async_client(self):
+        """AsyncOpenAI client bound to the running loop's shared HTTP client."""
+        http = _get_http()
+        if self._async_client_http is not http:
+            import openai
+
+            self._async_client = openai.AsyncOpenAI(api_key=self.api_key, http_client=http)
+            self._async_client_http = http
+        return self._async_client
+
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         if not self.api_key:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="OPENAI_API_KEY not set",
-            )
+            return self._failure("OPENAI_API_KEY not set")
+        if not _HAS_OPENAI:
+            return self._failure("openai not installed. Run: pip install openai")
 
         try:
-            import openai
+            client = self._ensure_client()
+            return self._parse(client.chat.completions.create(**self._request(claim, domain)))
+        except Exception as e:
+            return self._failure(str(e))
 
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
+    def validate_batch(self, claims: list[tuple[str, str]]) -> list[ValidationResult]:
+        """
+        Validate many claims through the OpenAI Batch API.
+
+        Half the cost of individual calls; results may take up to 24 hours.
+        """
+        if not claims:
+            return []
+        if not self.api_key:
+            return [self._failure("OPENAI_API_KEY not set")] * len(claims)
+        if not _HAS_OPENAI:
+            return [self._failure("openai not installed. Run: pip install openai")] * len(claims)
+
+        try:
+            client = self._ensure_client()
+            lines = b"\n".join(
+                orjson.dumps(
                     {
-                        "role": "user",
-                        "content": self.PROMPT.format(claim=claim, domain=domain),
+                        "custom_id": str(i),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._request(claim, domain),
                     }
-                ],
-                max_tokens=256,
-                response_format={"type": "json_object"},
+                )
+                for i, (claim, domain) in enumerate(claims)
+            )
+            batch_file = client.files.create(file=("claims.jsonl", lines), purpose="batch")
+            job = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            job = _wait_for_batch(
+                lambda: client.batches.retrieve(job.id),
+                lambda j: j.status in ("completed", "failed", "expired", "cancelled"),
             )
 
-            text = response.choices[0].message.content
-            parsed = json.loads(text)
+            results = {}
+            for file_id in (job.output_file_id, job.error_file_id):
+                if not file_id:
+                    continue
+                for line in client.files.content(file_id).text.splitlines():
+                    entry = orjson.loads(line)
+                    results[entry["custom_id"]] = self._parse_batch_line(entry)
+
+            return [
+                results.get(str(i), self._failure(f"Batch {job.status} without a result"))
+                for i in range(len(claims))
+            ]
+        except Exception as e:
+            return [self._failure(str(e))] * len(claims)
 
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=float(parsed["confidence"]),
-                reasoning=parsed["reasoning"],
-                model=self.model,
-                tokens_used=response.usage.total_tokens,
-            )
+    @cached_validation
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        if not self.api_key:
+            return self._failure("OPENAI_API_KEY not set")
+        if not _HAS_OPENAI:
+            return self._failure("openai not installed. Run: pip install openai")
 
-        except ImportError:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="openai not installed. Run: pip install openai",
+        try:
+            client = self._ensure_async_client()
+            request = self._request(claim, domain)
+            return self._parse(
+                await self._limited(lambda: client.chat.completions.create(**request))
             )
         except Exception as e:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error=str(e),
-            )
+            return self._failure(str(e))
 
 
 class GeminiValidator(Validator):
     """Validator using Google's Gemini API."""
 
-    PROMPT = """Analyze this claim for accuracy. Respond with JSON only:
-{{"confidence": <0-1>, "reasoning": "<brief explanation>"}}
+    PROMPT = CLOUD_PROMPT
+    _PROMPT_PARTS = _CLOUD_PROMPT_PARTS
 
-Claim: {claim}
-Domain: {domain}"""
+    GENERATION_CONFIG = {"response_mime_type": "application/json"}
 
     def __init__(self, model: str = "gemini-1.5-flash"):
         self.model = model
         self.api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        self._client = None
 
     @property
     def name(self) -> str:
@@ -369,49 +1082,65 @@ Domain: {domain}"""
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def _ensure_client(self):
+        """GenerativeModel, configured once and reused for every call."""
+        if self._client is None:
+            import google.generativeai as genai
+
+            genai.configure(api_key=self.api_key)
+            self._client = genai.GenerativeModel(self.model)
+        return self._client
+
+    def _parse(self, response) -> ValidationResult:
+        parsed = orjson.loads(response.text)
+
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=float(parsed["confidence"]),
+            reasoning=parsed["reasoning"],
+            model=self.model,
+        )
+
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         if not self.api_key:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="GEMINI_API_KEY not set",
-            )
+            return self._failure("GEMINI_API_KEY not set")
 
         try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model)
+            response = self._ensure_client().generate_content(
+                self._prompt(claim, domain),
+                generation_config=self.GENERATION_CONFIG,
+            )
+            return self._parse(response)
 
-            response = model.generate_content(
-                self.PROMPT.format(claim=claim, domain=domain),
-                generation_config={"response_mime_type": "application/json"},
+        except ImportError:
+            return self._failure(
+                "google-generativeai not installed. Run: pip install google-generativeai"
             )
+        except Exception as e:
+            return self._failure(str(e))
 
-            parsed = json.loads(response.text)
+    @cached_validation
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        if not self.api_key:
+            return self._failure("GEMINI_API_KEY not set")
 
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=float(parsed["confidence"]),
-                reasoning=parsed["reasoning"],
-                model=self.model,
+        try:
+            model = self._ensure_client()
+            response = await self._limited(
+                lambda: model.generate_content_async(
+                    self._prompt(claim, domain),
+                    generation_config=self.GENERATION_CONFIG,
+                )
             )
+            return self._parse(response)
 
         except ImportError:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error="google-generativeai not installed. Run: pip install google-generativeai",
+            return self._failure(
+                "google-generativeai not installed. Run: pip install google-generativeai"
             )
         except Exception as e:
-            return ValidationResult(
-                validator_name=self.name,
-                confidence=0,
-                reasoning="",
-                error=str(e),
-            )
+            return self._failure(str(e))
 
 
 # =============================================================================
@@ -430,11 +1159,8 @@ class HuggingFaceValidator(Validator):
     Models: meta-llama/Llama-3-8b-hf, mistralai/Mistral-7B-Instruct-v0.2, etc.
     """
 
-    PROMPT = """Analyze this claim for accuracy. Respond with JSON only:
-{{"confidence": <0-1>, "reasoning": "<brief explanation>"}}
-
-Claim: {claim}
-Domain: {domain}"""
+    PROMPT = CLOUD_PROMPT
+    _PROMPT_PARTS = _CLOUD_PROMPT_PARTS
 
     def __init__(
         self,
@@ -468,6 +1194,7 @@ Domain: {domain}"""
             except ImportError:
                 return False
 
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         if self.use_api:
             return self._validate_api(claim, domain)
@@ -485,11 +1212,9 @@ Domain: {domain}"""
             )
 
         try:
-            import httpx
+            prompt = self._prompt(claim, domain)
 
-            prompt = self.PROMPT.format(claim=claim, domain=domain)
-
-            response = httpx.post(
+            response = _get_http_client().post(
                 f"https://api-inference.huggingface.co/models/{self.model}",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json={
@@ -503,7 +1228,7 @@ Domain: {domain}"""
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
             if isinstance(result, list) and len(result) > 0:
                 text = result[0].get("generated_text", "{}")
             else:
@@ -512,17 +1237,15 @@ Domain: {domain}"""
             # Parse JSON response
             try:
                 # Try to extract JSON from response
-                import re
-
                 json_match = re.search(r"\{.*\}", text, re.DOTALL)
                 if json_match:
-                    parsed = json.loads(json_match.group())
+                    parsed = orjson.loads(json_match.group())
                     confidence = float(parsed.get("confidence", 0.5))
                     reasoning = parsed.get("reasoning", "No reasoning")
                 else:
                     confidence = 0.5
                     reasoning = text[:200] if text else "Could not parse"
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 confidence = 0.5
                 reasoning = text[:200] if text else "Could not parse"
 
@@ -553,7 +1276,7 @@ Domain: {domain}"""
         try:
             from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
 
-            prompt = self.PROMPT.format(claim=claim, domain=domain)
+            prompt = self._prompt(claim, domain)
 
             # Load model and tokenizer
             tokenizer = AutoTokenizer.from_pretrained(self.model)
@@ -578,17 +1301,15 @@ Domain: {domain}"""
 
             # Parse JSON
             try:
-                import re
-
                 json_match = re.search(r"\{.*\}", text, re.DOTALL)
                 if json_match:
-                    parsed = json.loads(json_match.group())
+                    parsed = orjson.loads(json_match.group())
                     confidence = float(parsed.get("confidence", 0.5))
                     reasoning = parsed.get("reasoning", "No reasoning")
                 else:
                     confidence = 0.5
                     reasoning = text[:200]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 confidence = 0.5
                 reasoning = text[:200]
 
@@ -649,6 +1370,8 @@ Respond with JSON only:
 
 Apply your training: verify linguistic coherence, factual grounding, and consensus alignment."""
 
+    _PROMPT_PARTS = _precompile(PROMPT)
+
     def __init__(
         self,
         endpoint: str | None = None,
@@ -665,6 +1388,11 @@ Apply your training: verify linguistic coherence, factual grounding, and consens
     def name(self) -> str:
         return "LOGOS6"
 
+    @property
+    def cache_tag(self) -> str:
+        # No model attribute: different endpoints are different models
+        return f"{self.project}/{self.location}/{self.endpoint}"
+
     def is_available(self) -> bool:
         """Check if Vertex AI is accessible."""
         try:
@@ -686,6 +1414,7 @@ Apply your training: verify linguistic coherence, factual grounding, and consens
         self._model = GenerativeModel(self.endpoint)
         self._initialized = True
 
+    @cached_validation
     def validate(self, claim: str, domain: str = "general") -> ValidationResult:
         if not self.is_available():
             return ValidationResult(
@@ -698,22 +1427,20 @@ Apply your training: verify linguistic coherence, factual grounding, and consens
         try:
             self._ensure_initialized()
 
-            prompt = self.PROMPT.format(claim=claim, domain=domain)
+            prompt = self._prompt(claim, domain)
             response = self._model.generate_content(prompt)
             text = response.text
 
             # Parse JSON response
             try:
-                parsed = json.loads(text)
+                parsed = orjson.loads(text)
                 confidence = float(parsed.get("confidence", 0.5))
                 reasoning = parsed.get("reasoning", "No reasoning provided")
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Try to extract JSON from response
-                import re
-
                 json_match = re.search(r"\{.*\}", text, re.DOTALL)
                 if json_match:
-                    parsed = json.loads(json_match.group())
+                    parsed = orjson.loads(json_match.group())
                     confidence = float(parsed.get("confidence", 0.5))
                     reasoning = parsed.get("reasoning", "No reasoning")
                 else:
@@ -744,6 +1471,9 @@ Apply your training: verify linguistic coherence, factual grounding, and consens
 class HumanValidator(Validator):
     """Interactive human validation via CLI."""
 
+    timeout = None
+    interactive = True
+
     def __init__(self, name: str = "HUMAN"):
         self._name = name
 
@@ -778,41 +1508,111 @@ class HumanValidator(Validator):
                 error=str(e),
             )
 
+    BATCH_HEADER = """\
+# TruthGit human validation: fill in CONFIDENCE (0-100) and REASONING for
+# each claim, keeping the tab-separated columns, then save and exit.
+# Rows left without a confidence are reported as errors.
+# IDX\tCLAIM\tDOMAIN\tCONFIDENCE\tREASONING
+"""
+
+    def validate_batch(self, claims: list[tuple[str, str]]) -> list[ValidationResult]:
+        """
+        Validate many claims in one $EDITOR session.
+
+        All claims are written to a tab-separated file that the reviewer
+        fills in at once; a single claim still uses the stdin prompts.
+        """
+        if len(claims) <= 1:
+            return super().validate_batch(claims)
+
+        def cell(text: str) -> str:
+            return " ".join(text.split())
+
+        rows = "".join(
+            f"{i}\t{cell(claim)}\t{cell(domain)}\t\t\n" for i, (claim, domain) in enumerate(claims)
+        )
+        fd, path = tempfile.mkstemp(prefix="truthgit-", suffix=".tsv", text=True)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.BATCH_HEADER + rows)
+            editor = shlex.split(os.environ.get("EDITOR") or "nano")
+            subprocess.run([*editor, path], check=True)
+            with open(path, encoding="utf-8") as f:
+                answers = self._parse_batch(f.read())
+        except (OSError, subprocess.CalledProcessError) as e:
+            return [self._failure(f"Editor failed: {e}")] * len(claims)
+        finally:
+            os.unlink(path)
+
+        return [
+            answers.get(i) or self._failure(f"No confidence given for claim {i}")
+            for i in range(len(claims))
+        ]
+
+    def _parse_batch(self, text: str) -> dict[int, ValidationResult]:
+        """Filled-in rows by index; rows without a valid confidence are skipped."""
+        answers = {}
+        for line in text.splitlines():
+            if not line.strip() or line.startswith("#"):
+                continue
+            fields = line.split("\t", 4)
+            if len(fields) < 4:
+                continue
+            try:
+                idx = int(fields[0])
+                confidence = float(fields[3]) / 100.0
+            except ValueError:
+                continue
+            answers[idx] = ValidationResult(
+                validator_name=self.name,
+                confidence=min(1.0, max(0.0, confidence)),
+                reasoning=fields[4].strip() if len(fields) > 4 else "",
+            )
+        return answers
+
 
 # =============================================================================
 # VALIDATOR REGISTRY
 # =============================================================================
 
 
+_CLOUD_VALIDATORS = (
+    ClaudeValidator,
+    GPTValidator,
+    GeminiValidator,
+    HuggingFaceValidator,  # HuggingFace Inference API
+)
+
+
 def _get_ollama_models() -> list[str]:
     """Get list of available Ollama models."""
-    try:
-        import httpx
+    return [name.split(":")[0] for name in _ollama_tags(f"{ollama_base_url()}/api/tags")]
 
-        response = httpx.get("http://localhost:11434/api/tags", timeout=2)
-        if response.status_code == 200:
-            data = response.json()
-            models = data.get("models", [])
-            return [m.get("name", "").split(":")[0] for m in models]
-    except Exception:
-        pass
-    return []
 
+# Environment variables that decide which cloud validators are available
+_PROVIDER_ENV_VARS = (
+    "ANTHROPIC_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "GOOGLE_API_KEY",
+    "HF_TOKEN",
+    "HUGGINGFACE_TOKEN",
+)
+_PROBE_TIMEOUT = 2.0
 
-def get_default_validators(local_only: bool = False) -> list[Validator]:
-    """
-    Get default validators based on availability.
 
-    Args:
-        local_only: If True, only use local validators (Ollama)
+async def _probe(validator: Validator) -> bool:
+    """is_available() off the loop, treating errors and slow probes as unavailable."""
+    try:
+        return await asyncio.wait_for(validator._ais_available(), _PROBE_TIMEOUT)
+    except Exception:
+        return False
 
-    Returns:
-        List of available validators
-    """
-    validators = []
 
+async def _discover_validators(local_only: bool) -> list[Validator]:
+    """Probe every candidate validator concurrently."""
     # Get actually available Ollama models
-    available_ollama = _get_ollama_models()
+    available_ollama = await asyncio.to_thread(_get_ollama_models)
 
     # Prefer diverse models, fallback to whatever is available
     # NOTE: logos-v1 to logos-v5 are local experiments, not functional validators
@@ -831,79 +1631,316 @@ def get_default_validators(local_only: bool = False) -> list[Validator]:
     ollama_models = [m for m in preferred_models if m in available_ollama]
     if not ollama_models:
         # Use available models excluding experimental logos
-        ollama_models = [m for m in available_ollama if m not in excluded_models][:3]
+        ollama_models = list(
+            dict.fromkeys(m for m in available_ollama if m not in excluded_models)
+        )[:3]
+
+    ollama = list(dict.fromkeys(OllamaValidator(model) for model in ollama_models))
+    # Logos6 (our trained model) first, then the other cloud validators
+    cloud = [] if local_only else [Logos6Validator(), *(cls() for cls in _CLOUD_VALIDATORS)]
 
-    for model in ollama_models:
-        v = OllamaValidator(model)
-        if v.is_available():
-            validators.append(v)
-            break  # One Ollama model is enough for local
+    candidates = ollama + cloud
+    available = await asyncio.gather(*(_probe(v) for v in candidates))
+    found = [v for v, ok in zip(candidates, available) if ok]
 
+    local = [v for v in found if isinstance(v, OllamaValidator)]
     if local_only:
         # For local mode, use multiple Ollama models for diversity
-        for model in ollama_models:
-            v = OllamaValidator(model)
-            if v.is_available() and v.name not in [x.name for x in validators]:
-                validators.append(v)
-                if len(validators) >= 3:
-                    break
-    else:
-        # Prioritize Logos6 (our trained model) if available
-        logos6 = Logos6Validator()
-        if logos6.is_available():
-            validators.append(logos6)
-
-        # Add cloud validators if available
-        cloud_validators = [
-            ClaudeValidator(),
-            GPTValidator(),
-            GeminiValidator(),
-            HuggingFaceValidator(),  # HuggingFace Inference API
+        return local[:3]
+    # One Ollama model is enough for local
+    return local[:1] + [v for v in found if not isinstance(v, OllamaValidator)]
+
+
+def _run_sync(coro):
+    """
+    asyncio.run(coro) for sync entry points.
+
+    Called from async code (notebooks, async frameworks), where asyncio.run()
+    is unavailable, the coroutine runs on a private loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+@functools.lru_cache(maxsize=8)
+def _discover(local_only: bool, env: tuple[bool, ...], window: int) -> tuple[Validator, ...]:
+    """Memoized discovery; see get_default_validators() for the key."""
+    return tuple(_run_sync(_discover_validators(local_only)))
+
+
+def get_default_validators(local_only: bool = False) -> list[Validator]:
+    """
+    Get default validators based on availability.
+
+    Candidates are probed concurrently. The result is memoized per API-key
+    configuration and reused for _AVAILABILITY_TTL seconds, so Ollama
+    starting or stopping is picked up without re-probing on every claim.
+
+    Args:
+        local_only: If True, only use local validators (Ollama)
+
+    Returns:
+        List of available validators
+    """
+    env = tuple(bool(os.getenv(name)) for name in _PROVIDER_ENV_VARS)
+    window = int(time.monotonic() // _AVAILABILITY_TTL)
+    return list(_discover(local_only, env, window))
+
+
+# Claims above this size are rejected rather than sent to every model
+MAX_CLAIM_CHARS = 8000
+_WORD_RE = re.compile(r"\w")
+
+
+def _is_trivial(claim: str) -> bool:
+    """Empty, near-empty or punctuation-only claims are not worth an LLM call."""
+    return len(claim.strip()) < 3 or not _WORD_RE.search(claim)
+
+
+def check_claim(claim: str, max_claim_chars: int = MAX_CLAIM_CHARS) -> str | None:
+    """Why a claim must not reach the validators, or None if it may."""
+    if _is_trivial(claim):
+        return "empty or trivial claim"
+    if len(claim) > max_claim_chars:
+        return f"Claim too long ({len(claim)} > {max_claim_chars} characters)"
+    return None
+
+
+def _precheck(
+    claim: str, validators: list[Validator], max_claim_chars: int
+) -> list[ValidationResult] | None:
+    """Synthetic results for claims that must not reach the validators, else None."""
+    reason = check_claim(claim, max_claim_chars)
+    if reason is None:
+        return None
+    if _is_trivial(claim):
+        # Not an error: the claim simply carries no confidence
+        return [
+            ValidationResult(validator_name=v.name, confidence=0.0, reasoning=reason)
+            for v in validators
         ]
-        for v in cloud_validators:
-            if v.is_available():
-                validators.append(v)
+    return [v._failure(reason) for v in validators]
+
 
+def _resolve_validators(validators: list[Validator] | None, min_validators: int) -> list[Validator]:
+    """Default validators if none were given; enforce the minimum."""
+    if validators is None:
+        validators = get_default_validators()
+
+    if len(validators) < min_validators:
+        raise ValueError(
+            f"Need at least {min_validators} validators, "
+            f"found {len(validators)}. Install Ollama or set API keys."
+        )
     return validators
 
 
-def validate_claim(
+def _average_confidence(results: list[ValidationResult]) -> float:
+    """Average confidence, excluding errors."""
+    successful = [r for r in results if r.success]
+    if not successful:
+        return 0.0
+    return sum(r.confidence for r in successful) / len(successful)
+
+
+async def avalidate_with_timeout(
+    validator: Validator, claim: str, domain: str = "general"
+) -> ValidationResult:
+    """
+    Run validator.avalidate(), reporting any exception as an error result.
+
+    validator.timeout bounds each provider call (see Validator._timed), not
+    the time spent queued behind the provider's concurrency and rate limits.
+    """
+    try:
+        return await validator.avalidate(claim, domain)
+    except Exception as e:
+        return validator._failure(str(e) or repr(e))
+
+
+def _validate_in_threads(
+    claim: str, domain: str, validators: list[Validator]
+) -> list[ValidationResult]:
+    """Run the sync validate() of every validator in a thread pool, in order."""
+    if not validators:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(validators))) as pool:
+        futures = [pool.submit(v.validate, claim, domain) for v in validators]
+
+    results = []
+    for v, future in zip(validators, futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(v._failure(str(e)))
+    return results
+
+
+async def avalidate_claim(
     claim: str,
     domain: str = "general",
     validators: list[Validator] | None = None,
     min_validators: int = 2,
+    max_claim_chars: int = MAX_CLAIM_CHARS,
 ) -> tuple[list[ValidationResult], float]:
     """
-    Validate a claim using multiple validators.
+    Validate a claim using multiple validators concurrently.
+
+    All validators are queried at once, so wall time is that of the slowest
+    one rather than the sum of all of them. A validator that raises or
+    exceeds its timeout yields an error result; the others still count.
+    Trivial claims get a zero
+    confidence and oversized ones an error, without calling any validator.
 
     Args:
         claim: The statement to validate
         domain: Knowledge domain
         validators: List of validators (default: auto-detect)
         min_validators: Minimum validators required
+        max_claim_chars: Longest claim sent to the validators
 
     Returns:
-        Tuple of (results list, average confidence)
+        Tuple of (results list, average confidence), results in validator order
     """
-    if validators is None:
-        validators = get_default_validators()
+    validators = _resolve_validators(validators, min_validators)
 
-    if len(validators) < min_validators:
-        raise ValueError(
-            f"Need at least {min_validators} validators, "
-            f"found {len(validators)}. Install Ollama or set API keys."
-        )
+    prechecked = _precheck(claim, validators, max_claim_chars)
+    if prechecked is not None:
+        return prechecked, _average_confidence(prechecked)
 
-    results = []
+    results = list(
+        await asyncio.gather(*(avalidate_with_timeout(v, claim, domain) for v in validators))
+    )
+
+    return results, _average_confidence(results)
+
+
+def _ask_in_turn(
+    validators: list[Validator], claims: list[tuple[str, str]]
+) -> list[list[ValidationResult]]:
+    """Run interactive validators one after another, each over every claim."""
+    answers = []
     for v in validators:
-        result = v.validate(claim, domain)
-        results.append(result)
+        try:
+            answers.append(v.validate_batch(claims))
+        except Exception as e:
+            answers.append([v._failure(str(e) or repr(e))] * len(claims))
+    return answers
 
-    # Calculate average confidence (excluding errors)
-    successful = [r for r in results if r.success]
-    if successful:
-        avg_confidence = sum(r.confidence for r in successful) / len(successful)
+
+def validate_claims(
+    claims: list[tuple[str, str]],
+    validators: list[Validator] | None = None,
+    min_validators: int = 2,
+    use_batch_api: bool = False,
+    max_claim_chars: int = MAX_CLAIM_CHARS,
+) -> list[tuple[list[ValidationResult], float]]:
+    """
+    Validate many (claim, domain) pairs.
+
+    With use_batch_api, each validator receives every claim in a single
+    validate_batch() call (provider Batch APIs: half price, but results can
+    take hours). Otherwise all claims and validators are queried concurrently,
+    except interactive ones (HumanValidator), which get every claim in one
+    validate_batch() session after another. Inside a running event loop the
+    work runs on a private loop in a worker thread (prefer avalidate_claim()
+    there, which does not block the caller's loop).
+
+    Returns:
+        One (results list, average confidence) tuple per claim, in input order
+    """
+    validators = _resolve_validators(validators, min_validators)
+
+    validated = [_precheck(claim, validators, max_claim_chars) for claim, _ in claims]
+    pending = [i for i, results in enumerate(validated) if results is None]
+    to_send = [claims[i] for i in pending]
+
+    async def run() -> list[list[ValidationResult]]:
+        try:
+            if use_batch_api:
+                per_validator = await asyncio.gather(
+                    *(asyncio.to_thread(v.validate_batch, to_send) for v in validators)
+                )
+                return [list(results) for results in zip(*per_validator)]
+            automatic = [v for v in validators if not v.interactive]
+            interactive = [v for v in validators if v.interactive]
+            per_claim, per_person = await asyncio.gather(
+                asyncio.gather(
+                    *(
+                        avalidate_claim(claim, domain, automatic, 0, max_claim_chars)
+                        for claim, domain in to_send
+                    )
+                ),
+                asyncio.to_thread(_ask_in_turn, interactive, to_send),
+            )
+            # Back into validator order
+            merged = []
+            for i, (results, _) in enumerate(per_claim):
+                answers, asked = iter(results), iter(per_person)
+                merged.append(
+                    [next(asked)[i] if v.interactive else next(answers) for v in validators]
+                )
+            return merged
+        finally:
+            await aclose_http()
+
+    if to_send:
+        for i, results in zip(pending, _run_sync(run())):
+            validated[i] = results
+    return [(results, _average_confidence(results)) for results in validated]
+
+
+def validate_claim(
+    claim: str,
+    domain: str = "general",
+    validators: list[Validator] | None = None,
+    min_validators: int = 2,
+    use_batch_api: bool = False,
+    max_claim_chars: int = MAX_CLAIM_CHARS,
+) -> tuple[list[ValidationResult], float]:
+    """
+    Validate a claim using multiple validators.
+
+    Synchronous wrapper around avalidate_claim(); validators still run
+    concurrently. Called from inside a running event loop (notebooks, async
+    frameworks), where asyncio.run() is unavailable, each validator's sync
+    validate() runs in a thread pool instead.
+
+    Args:
+        claim: The statement to validate
+        domain: Knowledge domain
+        validators: List of validators (default: auto-detect)
+        min_validators: Minimum validators required
+        use_batch_api: Submit through provider Batch APIs (see validate_claims)
+        max_claim_chars: Longest claim sent to the validators
+
+    Returns:
+        Tuple of (results list, average confidence)
+    """
+    if use_batch_api:
+        return validate_claims(
+            [(claim, domain)], validators, min_validators, True, max_claim_chars
+        )[0]
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
     else:
-        avg_confidence = 0.0
+        validators = _resolve_validators(validators, min_validators)
+        results = _precheck(claim, validators, max_claim_chars)
+        if results is None:
+            results = _validate_in_threads(claim, domain, validators)
+        return results, _average_confidence(results)
+
+    async def run() -> tuple[list[ValidationResult], float]:
+        try:
+            return await avalidate_claim(claim, domain, validators, min_validators, max_claim_chars)
+        finally:
+            await aclose_http()
 
-    return results, avg_confidence
+    return asyncio.run(run())
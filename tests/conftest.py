@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path_factory, monkeypatch):
+    """Keep validator verdicts out of ~/.truthgit/cache during tests."""
+    monkeypatch.setenv("TRUTHGIT_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture(autouse=True)
+def fresh_validator_discovery(monkeypatch):
+    """Forget memoized discovery and Ollama probes between tests."""
+    from truthgit import validators
+
+    monkeypatch.setattr(validators, "_AVAILABILITY_CACHE", {})
+    monkeypatch.setattr(validators, "_PARALLELISM_CHECKED", set())
+    validators._discover.cache_clear()
+    yield
+    validators._discover.cache_clear()
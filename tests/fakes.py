@@ -0,0 +1,31 @@
+"""Validator test doubles shared by the test modules."""
+
+from truthgit.validators import ValidationResult, Validator
+
+
+class FakeValidator(Validator):
+    """Validator returning a fixed confidence without network access."""
+
+    def __init__(self, name: str, confidence: float = 0.9):
+        self._name = name
+        self.confidence = confidence
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def validate(self, claim: str, domain: str = "general") -> ValidationResult:
+        self.calls += 1
+        return ValidationResult(
+            validator_name=self.name,
+            confidence=self.confidence,
+            reasoning=f"{self.name} checked: {claim}",
+        )
+
+
+class FailingValidator(FakeValidator):
+    """Validator whose SDK call raises."""
+
+    def validate(self, claim: str, domain: str = "general") -> ValidationResult:
+        raise RuntimeError("provider exploded")
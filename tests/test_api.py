@@ -0,0 +1,375 @@
+"""Tests for the TruthGit FastAPI server."""
+
+import asyncio
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from truthgit import validators
+from truthgit.api import server
+from truthgit.objects import ObjectType
+from truthgit.validators import ValidationResult
+
+from .fakes import FailingValidator, FakeValidator
+
+
+class BarrierValidator(FakeValidator):
+    """Validator that only returns once every peer has started."""
+
+    def __init__(self, name: str, barrier: threading.Barrier):
+        super().__init__(name)
+        self.barrier = barrier
+
+    def validate(self, claim: str, domain: str = "general") -> ValidationResult:
+        self.barrier.wait(timeout=5)
+        return super().validate(claim, domain)
+
+
+@pytest.fixture
+def fake_validators():
+    return [FakeValidator("ALPHA"), FakeValidator("BETA")]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, fake_validators):
+    monkeypatch.chdir(tmp_path)
+    with patch.object(server, "select_validators", return_value=fake_validators):
+        with TestClient(server.app) as c:
+            yield c
+
+
+class TestValidatorSelection:
+    """Validators are resolved once at startup."""
+
+    def test_validators_cached_on_app_state(self, client, fake_validators):
+        assert server.app.state.validators == fake_validators
+
+    def test_verify_uses_cached_validators(self, client, fake_validators):
+        with patch.object(server, "select_validators") as select:
+            response = client.post("/api/verify", json={"claim": "Water is wet"})
+            select.assert_not_called()
+
+        body = response.json()
+        assert body["success"]
+        assert body["data"]["passed"]
+        assert [v["name"] for v in body["data"]["validators"]] == ["ALPHA", "BETA"]
+        assert all(v.calls == 1 for v in fake_validators)
+
+
+class TestHttpClient:
+    """Validators share one pooled HTTP client for the app's lifetime."""
+
+    def test_client_shared_and_closed_on_shutdown(self, tmp_path, monkeypatch, fake_validators):
+        monkeypatch.chdir(tmp_path)
+        with patch.object(server, "select_validators", return_value=fake_validators):
+            with TestClient(server.app):
+                shared = validators._get_http_client()
+                assert validators._get_http_client() is shared
+
+        assert shared.is_closed
+        assert validators._HTTP is None
+
+
+class TestConcurrentValidation:
+    """Validators are fanned out concurrently."""
+
+    def test_validators_run_in_parallel(self, client):
+        barrier = threading.Barrier(2)
+        server.app.state.validators = [
+            BarrierValidator("ALPHA", barrier),
+            BarrierValidator("BETA", barrier),
+        ]
+        body = client.post("/api/verify", json={"claim": "Water is wet"}).json()
+        assert body["success"]
+
+    def test_concurrent_verifies_commit_own_claim(self, client):
+        barrier = threading.Barrier(4)
+        server.app.state.validators = [
+            BarrierValidator("ALPHA", barrier),
+            BarrierValidator("BETA", barrier),
+        ]
+        claims = ["Water is wet", "Fire is hot"]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            bodies = list(
+                pool.map(lambda c: client.post("/api/verify", json={"claim": c}).json(), claims)
+            )
+        assert all(body["success"] for body in bodies)
+
+        for verification in server.repo.iter_objects(ObjectType.VERIFICATION):
+            context = server.repo.load(ObjectType.CONTEXT, verification.context_hash)
+            assert len(context.claims) == 1
+
+    def test_exception_reported_per_validator(self, client):
+        server.app.state.validators = [
+            FakeValidator("ALPHA"),
+            FakeValidator("BETA"),
+            FailingValidator("GAMMA"),
+        ]
+        body = client.post("/api/verify", json={"claim": "Water is wet"}).json()
+        assert body["success"]
+        gamma = body["data"]["validators"][2]
+        assert gamma["name"] == "GAMMA"
+        assert gamma["reasoning"] == "Error: provider exploded"
+
+    def test_timeout_reported_per_validator(self, client):
+        class HangingValidator(FakeValidator):
+            timeout = 0.01
+
+            async def avalidate(self, claim, domain="general"):
+                return await self._limited(lambda: asyncio.sleep(5))
+
+        server.app.state.validators = [
+            FakeValidator("ALPHA"),
+            FakeValidator("BETA"),
+            HangingValidator("GAMMA"),
+        ]
+        body = client.post("/api/verify", json={"claim": "Water is wet"}).json()
+        assert body["data"]["passed"]
+        assert body["data"]["validators"][2]["reasoning"] == "Error: Timed out after 0.01s"
+
+
+class TestVerificationCache:
+    """/api/prove reuses recent /api/verify results."""
+
+    def test_prove_after_verify_skips_validators(self, client, fake_validators):
+        client.post("/api/verify", json={"claim": "Water is wet"})
+        body = client.post("/api/prove", json={"claim": "Water is wet"}).json()
+
+        assert body["success"]
+        cert = body["data"]["certificate"]
+        assert cert["verification"]["validators"] == ["ALPHA", "BETA"]
+        assert all(v.calls == 1 for v in fake_validators)
+
+    def test_prove_different_domain_runs_validators(self, client, fake_validators):
+        client.post("/api/verify", json={"claim": "Water is wet"})
+        client.post("/api/prove", json={"claim": "Water is wet", "domain": "physics"})
+        assert all(v.calls == 2 for v in fake_validators)
+
+    def test_entries_expire(self):
+        cache = server.VerificationCache(ttl=-1)
+        cache.put("claim", "general", None, None, [])
+        assert cache.get("claim", "general") is None
+
+    def test_lru_eviction(self):
+        cache = server.VerificationCache(maxsize=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, "general", None, None, [name])
+        assert cache.get("a", "general") is None
+        assert cache.get("c", "general") == (None, None, ["c"])
+
+
+class TestSearch:
+    """Full-text claim search."""
+
+    def test_search_finds_verified_claim(self, client):
+        client.post("/api/verify", json={"claim": "Water boils at 100C", "domain": "physics"})
+        body = client.get("/api/search", params={"query": "boils"}).json()
+        assert body["success"]
+        assert [c["content"] for c in body["data"]] == ["Water boils at 100C"]
+        assert body["data"][0]["domain"] == "physics"
+
+
+class TestResponseEnvelope:
+    """Standard response metadata."""
+
+    def test_timestamp_format(self, client):
+        meta = client.get("/api/status").json()["meta"]
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", meta["timestamp"])
+
+    def test_long_reasoning_truncated(self, client):
+        claim = "x" * 300
+        body = client.post("/api/verify", json={"claim": claim}).json()
+        reasoning = body["data"]["validators"][0]["reasoning"]
+        assert reasoning == f"ALPHA checked: {claim}"[:200] + "..."
+
+
+class TestRepoConfig:
+    """Repository config is cached until the file changes."""
+
+    def test_config_reloaded_on_change(self, client):
+        repo = server.repo
+        first = server.load_repo_config(repo)
+        assert server.load_repo_config(repo) is first
+
+        config = dict(first, consensus_threshold=0.9)
+        repo.config_file.write_text(json.dumps(config))
+        stat = repo.config_file.stat()
+        os.utime(repo.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert server.load_repo_config(repo)["consensus_threshold"] == 0.9
+
+
+class TestErrorHandling:
+    """Errors are reported through the standard envelope."""
+
+    @pytest.mark.parametrize("url", ["/api/verify", "/api/prove"])
+    def test_insufficient_validators_returns_503(self, client, url):
+        server.app.state.validators = [FakeValidator("ALPHA")]
+        response = client.post(url, json={"claim": "Water is wet"})
+
+        assert response.status_code == 503
+        body = response.json()
+        assert not body["success"]
+        assert body["data"] is None
+        assert "insufficient validators" in body["error"]
+        assert "processingTime" in body["meta"]
+
+    def test_unhandled_exception_returns_envelope(self, tmp_path, monkeypatch, fake_validators):
+        monkeypatch.chdir(tmp_path)
+        with patch.object(server, "select_validators", return_value=fake_validators):
+            with TestClient(server.app, raise_server_exceptions=False) as c:
+                with patch.object(server.repo, "search", side_effect=RuntimeError("index broken")):
+                    response = c.get(
+                        "/api/search",
+                        params={"query": "water"},
+                        headers={"Origin": "https://truthgit.com"},
+                    )
+
+        assert response.status_code == 500
+        assert "access-control-allow-origin" in response.headers
+        body = response.json()
+        assert not body["success"]
+        assert body["error"] == "index broken"
+
+    @pytest.mark.parametrize(
+        ("url", "payload"),
+        [
+            ("/api/verify", {"claim": "??"}),
+            ("/api/prove", {"claim": "??"}),
+            ("/api/prove-batch", [{"claim": "Water is wet"}, {"claim": "??"}]),
+        ],
+    )
+    def test_trivial_claim_rejected(self, client, fake_validators, url, payload):
+        response = client.post(url, json=payload)
+
+        assert response.status_code == 422
+        assert all(v.calls == 0 for v in fake_validators)
+
+    def test_oversized_claim_rejected(self, client):
+        response = client.post("/api/verify", json={"claim": "x" * 8001})
+        assert response.status_code == 422
+
+    def test_validation_error_returns_envelope(self, client):
+        response = client.post("/api/verify", json={"claim": "??"})
+
+        assert response.status_code == 422
+        body = response.json()
+        assert not body["success"]
+        assert body["data"] is None
+        assert body["error"] == "claim: Value error, empty or trivial claim"
+        assert "processingTime" in body["meta"]
+
+    @pytest.mark.parametrize(
+        ("method", "url", "status"), [("get", "/api/missing", 404), ("get", "/api/verify", 405)]
+    )
+    def test_router_errors_return_envelope(self, client, method, url, status):
+        response = client.request(method.upper(), url)
+
+        assert response.status_code == status
+        body = response.json()
+        assert not body["success"]
+        assert body["error"]
+
+
+class TestRecentClaims:
+    """Recent claims come from the verification history."""
+
+    def test_claims_lists_verified_claim(self, client):
+        client.post("/api/verify", json={"claim": "Water is wet", "domain": "physics"})
+        body = client.get("/api/claims").json()
+
+        assert body["success"]
+        assert [c["content"] for c in body["data"]] == ["Water is wet"]
+        assert body["data"][0]["domain"] == "physics"
+        assert body["data"][0]["status"] == "VERIFIED"
+
+
+class TestBatchProof:
+    """/api/prove-batch signs one Merkle root for many claims."""
+
+    def test_each_certificate_verifies(self, client):
+        claims = [{"claim": f"Claim number {i}"} for i in range(3)]
+        body = client.post("/api/prove-batch", json=claims).json()
+
+        assert body["success"]
+        certs = [r["certificate"] for r in body["data"]["results"]]
+        assert len({c["proof"]["signature"] for c in certs}) == 1
+        assert [c["proof"]["batch"]["index"] for c in certs] == [0, 1, 2]
+
+        for cert in certs:
+            result = client.post("/api/verify-proof", json={"certificate": cert}).json()
+            assert result["data"]["valid"], result["data"]["message"]
+
+    def test_tampered_certificate_rejected(self, client):
+        body = client.post(
+            "/api/prove-batch", json=[{"claim": "Water is wet"}, {"claim": "Fire is hot"}]
+        ).json()
+        cert = body["data"]["results"][1]["certificate"]
+        cert["claim"]["content"] = "Ice is cold"
+
+        result = client.post("/api/verify-proof", json={"certificate": cert}).json()
+        assert not result["data"]["valid"]
+        assert result["data"]["message"] == "Invalid Merkle path"
+
+    def test_compact_format(self, client):
+        body = client.post(
+            "/api/prove-batch",
+            json=[{"claim": "Water is wet", "format": "compact"}, {"claim": "Fire is hot"}],
+        ).json()
+        compact = body["data"]["results"][0]["certificate"]
+
+        result = client.post("/api/verify-proof", json={"certificate": compact}).json()
+        assert result["data"]["valid"]
+
+    def test_failed_claims_reported_in_place(self, client):
+        server.app.state.validators = [FakeValidator("ALPHA", 0.1), FakeValidator("BETA", 0.1)]
+        body = client.post("/api/prove-batch", json=[{"claim": "Moon is cheese"}]).json()
+
+        assert body["data"]["results"] == [
+            {"certificate": None, "error": "Claim did not pass verification"}
+        ]
+
+
+class TestConditionalRequests:
+    """Read-only endpoints answer 304 for unchanged payloads."""
+
+    @pytest.mark.parametrize("url", ["/api/status", "/api/claims", "/api/search?query=water"])
+    def test_not_modified(self, client, url):
+        client.post("/api/verify", json={"claim": "Water is wet"})
+        first = client.get(url)
+        etag = first.headers["etag"]
+
+        second = client.get(url, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_etag_changes_with_repo(self, client):
+        etag = client.get("/api/claims").headers["etag"]
+        client.post("/api/verify", json={"claim": "Water is wet"})
+
+        response = client.get("/api/claims", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestVerifyProof:
+    """/api/verify-proof accepts dict, JSON string and compact certificates."""
+
+    def test_json_string_certificate(self, client):
+        cert = client.post("/api/prove", json={"claim": "Water is wet"}).json()["data"][
+            "certificate"
+        ]
+        body = client.post("/api/verify-proof", json={"certificate": json.dumps(cert)}).json()
+        assert body["data"]["valid"]
+        assert body["data"]["claim"]["content"] == "Water is wet"
+
+    def test_malformed_certificate(self, client):
+        body = client.post("/api/verify-proof", json={"certificate": "{not json"}).json()
+        assert not body["data"]["valid"]
+        assert body["data"]["message"].startswith("Failed to parse certificate")
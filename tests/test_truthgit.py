@@ -1,16 +1,23 @@
 """Tests for TruthGit core functionality."""
 
+import json
+import sqlite3
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from truthgit import (
     Axiom,
     Claim,
+    RepositoryFormatError,
     TruthRepository,
     calculate_consensus,
     content_hash,
     verify_hash,
 )
+from truthgit.hashing import file_hash
 from truthgit.objects import (
     AxiomType,
     ClaimCategory,
@@ -42,6 +49,12 @@ class TestHashing:
         assert verify_hash(content, h)
         assert not verify_hash("wrong content", h)
 
+    def test_file_hash_matches_content_hash(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "doc.txt"
+            path.write_text("Water boils at 100°C", encoding="utf-8")
+            assert file_hash(path) == content_hash("Water boils at 100°C")
+
 
 class TestObjects:
     """Test truth objects."""
@@ -127,6 +140,22 @@ class TestRepository:
             repo.init()
             assert repo.is_initialized()
 
+    def test_refuses_sha256_repository(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            config = json.loads(repo.config_file.read_text())
+            config["version"] = "1.0.0"
+            del config["hash_algorithm"]
+            repo.config_file.write_text(json.dumps(config))
+
+            with pytest.raises(RepositoryFormatError, match="1.0.0"):
+                repo.is_initialized()
+
+            # Re-creating the repository is still allowed
+            repo.init(force=True)
+            assert repo.is_initialized()
+
     def test_claim_and_stage(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             repo = TruthRepository(Path(tmpdir) / ".truth")
@@ -182,3 +211,94 @@ class TestRepository:
             status = repo.status()
             assert status["initialized"]
             assert status["staged_count"] == 0
+
+    def test_search(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+
+            water = repo.claim(content="Water boils at 100 degrees", domain="physics")
+            repo.claim(content="Water is made of hydrogen and oxygen", domain="chemistry")
+            repo.claim(content="Paris is the capital of France", domain="geography")
+
+            # Staged claims are not searchable until verified
+            assert repo.search("water") == []
+            repo.verify(verifier_results={"A": (0.9, "ok"), "B": (0.9, "ok")})
+
+            results = repo.search("water")
+            assert len(results) == 2
+            assert results[0].status == "VERIFIED"
+            assert results[0].consensus > 0.66
+
+            results = repo.search("water boils?", domain="physics")
+            assert [c.hash for c in results] == [water.hash]
+
+            assert repo.search("water", domain="geography") == []
+            assert repo.search("!!!") == []
+
+    def test_search_index_backfill(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            claim = repo.claim(content="Light travels fast", domain="physics")
+            repo.verify(verifier_results={"A": (0.2, "no"), "B": (0.3, "no")})
+
+            # Repositories created before the index existed are migrated on open
+            repo.search_file.unlink()
+            repo.ensure_search_index()
+            hits = repo.search("light")
+            assert [c.hash for c in hits] == [claim.hash]
+            assert hits[0].status == "DISPUTED"
+
+    def test_verify_survives_search_index_failure(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            claim = repo.claim(content="Light travels fast", domain="physics")
+
+            error = sqlite3.OperationalError("database is locked")
+            with patch.object(repo, "_index_verification", side_effect=error):
+                verification = repo.verify(verifier_results={"A": (0.9, "ok"), "B": (0.9, "ok")})
+
+            assert repo.get_ref("consensus/main") == verification.hash
+            assert [c.hash for c in repo.search("light")] == [claim.hash]
+
+    def test_failed_search_backfill_is_retried(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            claim = repo.claim(content="Light travels fast", domain="physics")
+            repo.verify(verifier_results={"A": (0.9, "ok"), "B": (0.9, "ok")})
+            repo.search_file.unlink()
+
+            with patch.object(repo, "iter_objects", side_effect=OSError("disk error")):
+                with pytest.raises(OSError):
+                    repo.ensure_search_index()
+
+            assert [c.hash for c in repo.search("light")] == [claim.hash]
+
+    def test_log(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            first = repo.claim(content="First", domain="test")
+            repo.verify(verifier_results={"A": (0.9, "ok"), "B": (0.9, "ok")})
+            second = repo.claim(content="Second", domain="test")
+            repo.verify(verifier_results={"A": (0.9, "ok"), "B": (0.9, "ok")})
+
+            log = repo.log()
+            assert [hit.hash for hit in log] == [second.hash, first.hash]
+            assert log[0].status == "VERIFIED"
+            assert log[0].consensus > 0.66
+            assert [hit.hash for hit in repo.log(limit=1)] == [second.hash]
+
+    def test_find_object_by_prefix(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = TruthRepository(Path(tmpdir) / ".truth")
+            repo.init()
+            claim = repo.claim(content="Test", domain="test")
+
+            assert repo.find_object_by_prefix(claim.hash[:1]) == (ObjectType.CLAIM, claim.hash)
+            assert repo.find_object_by_prefix(claim.hash[:6]) == (ObjectType.CLAIM, claim.hash)
+            assert repo.find_object_by_prefix(claim.hash.upper()) == (ObjectType.CLAIM, claim.hash)
+            assert repo.find_object_by_prefix("zz") is None
@@ -0,0 +1,881 @@
+"""Tests for TruthGit validators."""
+
+import asyncio
+import json
+import sys
+import threading
+import warnings
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from truthgit import validators as validators_module
+from truthgit.cache import ResponseCache, cached_validation, get_response_cache
+from truthgit.validators import (
+    ClaudeValidator,
+    GPTValidator,
+    HumanValidator,
+    OllamaValidator,
+    ValidationResult,
+    aclose_http,
+    avalidate_claim,
+    get_default_validators,
+    validate_claim,
+    validate_claims,
+)
+
+from .fakes import FailingValidator, FakeValidator
+
+
+class SlowAsyncValidator(FakeValidator):
+    """Native async validator that only finishes once every peer has started."""
+
+    def __init__(self, name: str, started: list, expected: int):
+        super().__init__(name)
+        self.started = started
+        self.expected = expected
+
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        self.started.append(self.name)
+        while len(self.started) < self.expected:
+            await asyncio.sleep(0)
+        return self.validate(claim, domain)
+
+
+@pytest.fixture
+def httpx_ollama(monkeypatch):
+    """Route Ollama through the shared httpx client even if aiohttp is installed."""
+    monkeypatch.setattr(validators_module, "_HAS_AIOHTTP", False)
+
+
+class TestValidateClaim:
+    """Validators are queried concurrently."""
+
+    def test_results_in_validator_order(self):
+        validators = [FakeValidator("A", 0.8), FakeValidator("B", 0.6)]
+        results, avg = validate_claim("Water is wet", validators=validators)
+
+        assert [r.validator_name for r in results] == ["A", "B"]
+        assert avg == pytest.approx(0.7)
+
+    def test_async_validators_overlap(self):
+        started: list[str] = []
+        validators = [SlowAsyncValidator(name, started, 3) for name in "ABC"]
+        results, _ = validate_claim("Water is wet", validators=validators)
+        assert [r.validator_name for r in results] == ["A", "B", "C"]
+
+    def test_sync_validators_run_in_threads(self):
+        barrier = threading.Barrier(2)
+
+        class BarrierValidator(FakeValidator):
+            def validate(self, claim, domain="general"):
+                barrier.wait(timeout=5)
+                return super().validate(claim, domain)
+
+        results, _ = validate_claim(
+            "Water is wet", validators=[BarrierValidator("A"), BarrierValidator("B")]
+        )
+        assert all(r.success for r in results)
+
+    def test_exception_becomes_error_result(self):
+        validators = [FakeValidator("A"), FailingValidator("B")]
+        results, avg = validate_claim("Water is wet", validators=validators)
+
+        assert results[1].validator_name == "B"
+        assert results[1].error == "provider exploded"
+        assert avg == pytest.approx(0.9)
+
+    def test_min_validators(self):
+        with pytest.raises(ValueError):
+            validate_claim("Water is wet", validators=[FakeValidator("A")])
+
+    def test_thread_pool_inside_running_loop(self):
+        barrier = threading.Barrier(2)
+
+        class BarrierValidator(FakeValidator):
+            def validate(self, claim, domain="general"):
+                barrier.wait(timeout=5)
+                return super().validate(claim, domain)
+
+        validators = [BarrierValidator("A"), BarrierValidator("B"), FailingValidator("C")]
+
+        async def run():
+            return validate_claim("Water is wet", validators=validators)
+
+        results, avg = asyncio.run(run())
+        assert [r.validator_name for r in results] == ["A", "B", "C"]
+        assert results[2].error == "provider exploded"
+        assert avg == pytest.approx(0.9)
+
+    @pytest.mark.parametrize("use_batch_api", [False, True])
+    def test_validate_claims_inside_running_loop(self, use_batch_api):
+        validators = [FakeValidator("A"), FakeValidator("B")]
+
+        async def run():
+            return (
+                validate_claims([("Water is wet", "general")], validators),
+                validate_claim("Water is wet", validators=validators, use_batch_api=use_batch_api),
+            )
+
+        many, one = asyncio.run(run())
+        assert many[0][1] == one[1] == pytest.approx(0.9)
+
+    def test_no_validators_inside_running_loop(self):
+        async def run():
+            return validate_claim("Water is wet", validators=[], min_validators=0)
+
+        assert asyncio.run(run()) == ([], 0.0)
+
+    @pytest.mark.parametrize("claim", ["", "  ", "ok", "?!...", "--- ***"])
+    def test_trivial_claim_skips_validators(self, claim):
+        validators = [FailingValidator("A"), FailingValidator("B")]
+        results, avg = validate_claim(claim, validators=validators)
+
+        assert [r.reasoning for r in results] == ["empty or trivial claim"] * 2
+        assert all(r.success for r in results)
+        assert avg == 0.0
+
+    def test_oversized_claim_rejected(self):
+        validators = [FailingValidator("A"), FailingValidator("B")]
+        results, avg = validate_claim("x" * 11, validators=validators, max_claim_chars=10)
+
+        assert results[0].error == "Claim too long (11 > 10 characters)"
+        assert avg == 0.0
+
+    def test_validate_claims_raised_claim_limit(self):
+        validators = [FakeValidator("A"), FakeValidator("B")]
+        validated = validate_claims([("x" * 9000, "general")], validators, max_claim_chars=20000)
+
+        assert all(r.success for r in validated[0][0])
+        assert validated[0][1] == pytest.approx(0.9)
+
+    def test_validate_claims_mixes_prechecked(self):
+        validators = [FakeValidator("A", 0.8), FakeValidator("B", 0.6)]
+        validated = validate_claims([("", "general"), ("Water is wet", "general")], validators)
+
+        assert validated[0][0][0].reasoning == "empty or trivial claim"
+        assert validated[1][1] == pytest.approx(0.7)
+
+    def test_slow_validator_times_out(self):
+        class HangingValidator(FakeValidator):
+            timeout = 0.01
+
+            async def avalidate(self, claim, domain="general"):
+                return await self._limited(lambda: asyncio.sleep(5))
+
+        validators = [FakeValidator("A"), FakeValidator("B"), HangingValidator("C")]
+        results, avg = validate_claim("Water is wet", validators=validators)
+
+        assert results[2].error == "Timed out after 0.01s"
+        assert avg == pytest.approx(0.9)
+
+    def test_queued_calls_do_not_time_out(self, monkeypatch):
+        class QueuedValidator(FakeValidator):
+            timeout = 0.1
+
+            async def avalidate(self, claim, domain="general"):
+                async def call():
+                    await asyncio.sleep(0.01)
+                    return FakeValidator.validate(self, claim, domain)
+
+                return await self._limited(call)
+
+        # 2 tokens, then one every 0.05 s: the last of 8 calls waits ~0.3 s
+        monkeypatch.setitem(validators_module._RATE_LIMITS, "QUEUED", (2, 0.1))
+        claims = [(f"Claim number {i}", "general") for i in range(8)]
+        validated = validate_claims(claims, [QueuedValidator("QUEUED")], min_validators=1)
+
+        assert all(results[0].success for results, _ in validated)
+
+    def test_own_timeout_error_not_reported_as_timeout(self):
+        class UntimedValidator(FakeValidator):
+            timeout = None
+
+            async def avalidate(self, claim, domain="general"):
+                raise TimeoutError("read timed out")
+
+        validators = [FakeValidator("A"), FakeValidator("B"), UntimedValidator("C")]
+        results, _ = validate_claim("Water is wet", validators=validators)
+
+        assert results[2].error == "read timed out"
+
+    def test_avalidate_claim(self):
+        validators = [FakeValidator("A"), FakeValidator("B")]
+        results, avg = asyncio.run(avalidate_claim("Water is wet", validators=validators))
+        assert len(results) == 2
+        assert avg == pytest.approx(0.9)
+
+
+@pytest.mark.usefixtures("httpx_ollama")
+class TestSharedAsyncClient:
+    """Async validators reuse one pooled client per event loop."""
+
+    def test_ollama_requests_share_client(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"response": '{"confidence": 0.8, "reasoning": "ok"}'})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            validators_module._ASYNC_HTTP[asyncio.get_running_loop()] = client
+
+            ollama = [OllamaValidator("llama3"), OllamaValidator("mistral")]
+            results, avg = await avalidate_claim("Water is wet", validators=ollama)
+            assert validators_module._get_http() is client
+
+            await aclose_http()
+            return client, results, avg
+
+        client, results, avg = asyncio.run(run())
+
+        assert [r.reasoning for r in results] == ["ok", "ok"]
+        assert avg == pytest.approx(0.8)
+        assert len(requests) == 2
+        assert client.is_closed
+
+    def test_ollama_aiohttp_session(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        monkeypatch.setattr(validators_module, "_HAS_AIOHTTP", True)
+
+        async def generate(request):
+            body = await request.json()
+            verdict = {"confidence": 0.8, "reasoning": body["model"]}
+            return web.json_response({"response": json.dumps(verdict)})
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/api/generate", generate)
+            async with TestServer(app) as server:
+                ollama = OllamaValidator("llama3", base_url=str(server.make_url("")))
+                try:
+                    return await ollama.avalidate("Water is wet")
+                finally:
+                    await aclose_http()
+
+        assert asyncio.run(run()).reasoning == "llama3"
+
+
+class TestPromptPrecompile:
+    """Prompts render from pre-split template parts."""
+
+    @pytest.mark.parametrize("validator", [OllamaValidator(), ClaudeValidator(), GPTValidator()])
+    def test_matches_format(self, validator):
+        template = getattr(validator, "PROMPT", None) or validator.PROMPT_TEMPLATE
+        claim = 'Sets use {braces} and "quotes"'
+        assert validator._prompt(claim, "math") == template.format(claim=claim, domain="math")
+
+    def test_cloud_prompt_shared(self):
+        assert ClaudeValidator.PROMPT is GPTValidator.PROMPT is validators_module.CLOUD_PROMPT
+        first = ClaudeValidator()._prompt("Water is wet", "physics")
+        assert GPTValidator()._prompt("Water is wet", "physics") is first
+
+    def test_field_mismatch(self):
+        with pytest.raises(ValueError):
+            validators_module._precompile("Domain: {domain}\nClaim: {claim}")
+
+
+class TestHumanBatch:
+    """HumanValidator collects many verdicts in one editor session."""
+
+    FILL = """\
+import sys
+
+path = sys.argv[1]
+lines = open(path).read().splitlines()
+answers = {"0": "90\\tobvious", "2": "ten\\tnot a number"}
+out = []
+for line in lines:
+    idx = line.split("\\t")[0]
+    out.append(line.rstrip("\\t") + "\\t" + answers[idx] if idx in answers else line)
+open(path, "w").write("\\n".join(out))
+"""
+
+    def test_editor_round_trip(self, tmp_path, monkeypatch):
+        script = tmp_path / "fill.py"
+        script.write_text(self.FILL)
+        monkeypatch.setenv("EDITOR", f"{sys.executable} {script}")
+
+        claims = [("Water\tis wet", "physics"), ("Fire is cold", "physics"), ("1+1=2", "math")]
+        results = HumanValidator().validate_batch(claims)
+
+        assert (results[0].confidence, results[0].reasoning) == (0.9, "obvious")
+        assert results[1].error == "No confidence given for claim 1"
+        assert not results[2].success
+
+    def test_editor_failure(self, monkeypatch):
+        monkeypatch.setenv("EDITOR", "false")
+        results = HumanValidator().validate_batch([("a b c", "x"), ("d e f", "x")])
+        assert all(r.error.startswith("Editor failed") for r in results)
+
+
+class TestOllamaParse:
+    """Ollama bodies are parsed straight from bytes."""
+
+    def test_json_response(self):
+        body = (
+            b'{"model": "llama3", '
+            b'"response": "{\\"confidence\\": 0.87, \\"reasoning\\": \\"ok\\"}"}'
+        )
+        result = OllamaValidator("llama3")._parse(body)
+        assert (result.confidence, result.reasoning) == (0.87, "ok")
+
+    def test_malformed_response_recovers_confidence(self):
+        body = b'{"response": "{\\"confidence\\": 0.3, \\"reasoning\\": \\"cut off"}'
+        result = OllamaValidator("llama3")._parse(body)
+        assert result.confidence == 0.3
+        assert result.reasoning.startswith('{"confidence"')
+
+
+class TestScoreOnlyStreaming:
+    """score_only Ollama validators stop reading once the confidence is known."""
+
+    @staticmethod
+    def fragments(sent):
+        for piece in ['{"confid', 'ence": 0.', "75, ", '"reasoning": "long', " answer", '"}']:
+            sent.append(piece)
+            yield orjson.dumps({"response": piece, "done": False}) + b"\n"
+        yield orjson.dumps({"response": "", "done": True}) + b"\n"
+
+    def test_sync_stream_stops_early(self, monkeypatch):
+        sent = []
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(orjson.loads(request.content))
+            return httpx.Response(200, content=self.fragments(sent))
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(validators_module, "_HTTP", client)
+
+        result = OllamaValidator("llama3", score_only=True).validate("Water is wet")
+
+        assert (result.confidence, result.reasoning) == (0.75, "")
+        assert bodies[0]["stream"] is True
+        assert len(sent) == 3
+
+    @pytest.mark.usefixtures("httpx_ollama")
+    def test_async_stream(self):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"".join(self.fragments(sent)))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            validators_module._ASYNC_HTTP[asyncio.get_running_loop()] = client
+            try:
+                return await OllamaValidator("llama3", score_only=True).avalidate("Water is wet")
+            finally:
+                await aclose_http()
+
+        assert asyncio.run(run()).confidence == 0.75
+
+    def test_truncated_stream_falls_back(self):
+        scanner = validators_module._ConfidenceScanner()
+        for line in [b'{"response": "{\\"confidence\\": 0.4", "done": false}', b'{"done": true}']:
+            scanner.feed(line)
+
+        result = OllamaValidator("llama3", score_only=True)._scanned(scanner)
+        assert result.confidence == 0.4
+
+    def test_cached_separately(self):
+        assert OllamaValidator("llama3") != OllamaValidator("llama3", score_only=True)
+
+
+class TestAvailabilityCache:
+    """Ollama /api/tags is probed once per TTL window."""
+
+    def test_probe_shared(self, monkeypatch):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                requests.append(request)
+            return httpx.Response(200, json={"models": [{"name": "llama3:latest"}]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(validators_module, "_HTTP", client)
+
+        assert OllamaValidator("llama3").is_available()
+        assert not OllamaValidator("mistral").is_available()
+        assert validators_module._get_ollama_models() == ["llama3"]
+        assert len(requests) == 1
+
+        monkeypatch.setattr(validators_module, "_AVAILABILITY_TTL", 0)
+        OllamaValidator("llama3").is_available()
+        assert len(requests) == 2
+
+    def test_unreachable(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(validators_module, "_HTTP", client)
+
+        assert not OllamaValidator("llama3").is_available()
+        assert validators_module._get_ollama_models() == []
+
+
+class TestOllamaConfig:
+    """Ollama server and client parallelism come from the environment."""
+
+    def test_base_url_from_env(self, monkeypatch):
+        monkeypatch.setenv("OLLAMA_BASE_URL", "http://gpu-box:11434/")
+        ollama = OllamaValidator("llama3")
+        assert ollama.generate_url == "http://gpu-box:11434/api/generate"
+        assert ollama.limit_key != OllamaValidator("llama3", base_url="http://other").limit_key
+
+    def test_extractor_uses_base_url(self, monkeypatch):
+        from truthgit.extractor import KnowledgeExtractor
+
+        monkeypatch.setenv("OLLAMA_BASE_URL", "http://gpu-box:11434/")
+        response = httpx.Response(
+            200, json={"response": "{}"}, request=httpx.Request("POST", "http://x")
+        )
+        with patch("httpx.post", return_value=response) as post:
+            KnowledgeExtractor(repository=None)._call_ollama("prompt")
+
+        assert post.call_args.args[0] == "http://gpu-box:11434/api/generate"
+
+    @pytest.mark.parametrize(("num_parallel", "warns"), [("1", True), ("4", False)])
+    def test_parallelism_warning(self, monkeypatch, num_parallel, warns):
+        def handler(request: httpx.Request) -> httpx.Response:
+            models = [{"name": "llama3:latest"}, {"name": "mistral:latest"}]
+            return httpx.Response(200, json={"models": models})
+
+        monkeypatch.setattr(
+            validators_module, "_HTTP", httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setenv("OLLAMA_CLIENT_CONCURRENCY", "8")
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", num_parallel)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert OllamaValidator("llama3").is_available()
+            OllamaValidator("mistral").is_available()
+
+        assert len(caught) == (1 if warns else 0)
+
+    def test_no_parallelism_probe_without_num_parallel(self, monkeypatch):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200, json={"models": [{"name": "llama3:latest"}]})
+
+        monkeypatch.setattr(
+            validators_module, "_HTTP", httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.delenv("OLLAMA_NUM_PARALLEL", raising=False)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert OllamaValidator("llama3").is_available()
+
+        assert not caught
+        assert "/api/ps" not in requests
+
+    @pytest.mark.parametrize("value", ["0", "-2", "eight"])
+    def test_invalid_client_concurrency_uses_default(self, monkeypatch, value):
+        monkeypatch.setenv("OLLAMA_CLIENT_CONCURRENCY", value)
+        with pytest.warns(RuntimeWarning, match="OLLAMA_CLIENT_CONCURRENCY"):
+            assert OllamaValidator("llama3").concurrency == 8
+
+
+class TestDefaultValidators:
+    """Validator discovery probes each model once."""
+
+    def test_equality(self):
+        assert OllamaValidator("llama3") == OllamaValidator("llama3")
+        assert len({OllamaValidator("llama3"), OllamaValidator("llama3")}) == 1
+        assert OllamaValidator("llama3") != OllamaValidator("mistral")
+        assert FakeValidator("A") != OllamaValidator("A")
+
+    def test_local_only_deduplicates(self, monkeypatch):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/tags":
+                requests.append(request)
+            names = ["phi4:latest", "phi4:14b", "codellama:latest"]
+            return httpx.Response(200, json={"models": [{"name": n} for n in names]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(validators_module, "_HTTP", client)
+
+        validators = get_default_validators(local_only=True)
+
+        assert [v.model for v in validators] == ["phi4", "codellama"]
+        assert len(requests) == 1
+
+    @pytest.fixture
+    def cloud(self, monkeypatch):
+        """Two cloud validators whose probes only succeed when run together."""
+        barrier = threading.Barrier(2)
+        probes = []
+
+        def make(name):
+            class Cloud(FakeValidator):
+                def __init__(self):
+                    super().__init__(name)
+
+                def is_available(self):
+                    probes.append(name)
+                    barrier.wait(timeout=1)
+                    return True
+
+            return Cloud
+
+        monkeypatch.setattr(validators_module, "_CLOUD_VALIDATORS", (make("A"), make("B")))
+        monkeypatch.setattr(validators_module, "_get_ollama_models", lambda: [])
+        monkeypatch.setattr(validators_module.Logos6Validator, "is_available", lambda self: False)
+        return probes
+
+    def test_probes_concurrent_and_memoized(self, cloud):
+        first = get_default_validators()
+        assert [v.name for v in first] == ["A", "B"]
+        assert get_default_validators() == first
+        assert len(cloud) == 2
+
+    def test_from_running_loop(self, cloud):
+        async def run():
+            return get_default_validators()
+
+        assert [v.name for v in asyncio.run(run())] == ["A", "B"]
+
+
+@pytest.mark.usefixtures("httpx_ollama")
+class TestRateLimits:
+    """avalidate() respects per-provider concurrency and rate limits."""
+
+    @staticmethod
+    def run_ollama(handler, models=("llama3",)):
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            validators_module._ASYNC_HTTP[asyncio.get_running_loop()] = client
+            try:
+                return await asyncio.gather(
+                    *(OllamaValidator(m).avalidate("Water is wet") for m in models)
+                )
+            finally:
+                await aclose_http()
+
+        return asyncio.run(run())
+
+    def test_token_bucket_throttles(self):
+        async def run():
+            bucket = validators_module.TokenBucket(1, 0.05)
+            start = asyncio.get_running_loop().time()
+            for _ in range(3):
+                await bucket.acquire()
+            return asyncio.get_running_loop().time() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+    def test_semaphore_bounds_concurrency(self, monkeypatch):
+        monkeypatch.setenv("OLLAMA_CLIENT_CONCURRENCY", "1")
+        in_flight = []
+        peak = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(request)
+            return httpx.Response(200, json={"response": '{"confidence": 0.8}'})
+
+        results = self.run_ollama(handler, ("llama3", "mistral", "phi3"))
+        assert all(r.success for r in results)
+        assert max(peak) == 1
+
+    def test_429_retried(self, monkeypatch):
+        monkeypatch.setattr(validators_module, "_RETRY_MIN", 0)
+        monkeypatch.setattr(validators_module, "_RETRY_MAX", 0)
+        statuses = iter([429, 429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"response": '{"confidence": 0.8}'})
+
+        [result] = self.run_ollama(handler)
+        assert result.confidence == 0.8
+
+    def test_other_errors_not_retried(self, monkeypatch):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500)
+
+        [result] = self.run_ollama(handler)
+        assert not result.success
+        assert len(calls) == 1
+
+
+class TestSdkClientCache:
+    """SDK clients are built once per validator, not once per claim."""
+
+    def test_claude_client_reused(self, monkeypatch):
+        created = []
+
+        class FakeAnthropic:
+            def __init__(self, api_key, http_client):
+                created.append(http_client)
+                self.messages = SimpleNamespace(create=self.create)
+
+            def create(self, **kwargs):
+                return SimpleNamespace(
+                    content=[SimpleNamespace(text='{"confidence": 0.7, "reasoning": "ok"}')],
+                    usage=SimpleNamespace(input_tokens=3, output_tokens=4),
+                )
+
+        monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+        monkeypatch.setattr(validators_module, "_HAS_ANTHROPIC", True)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+        claude = ClaudeValidator()
+        results = [claude.validate("Water is wet"), claude.validate("Fire is hot")]
+
+        assert [r.confidence for r in results] == [0.7, 0.7]
+        assert results[0].tokens_used == 7
+        assert len(created) == 1
+        assert created[0] is validators_module._get_http_client()
+
+
+class TestBatchValidation:
+    """Many claims can be submitted through provider Batch APIs."""
+
+    def test_default_validate_batch(self):
+        results = FakeValidator("A").validate_batch([("Water is wet", "physics"), ("Fire", "x")])
+        assert [r.reasoning for r in results] == ["A checked: Water is wet", "A checked: Fire"]
+
+    def test_validate_claims_batch_flag(self):
+        validators = [FakeValidator("A", 0.8), FakeValidator("B", 0.6)]
+        claims = [("Water is wet", "general"), ("Fire is hot", "general")]
+
+        for use_batch_api in (False, True):
+            validated = validate_claims(claims, validators, use_batch_api=use_batch_api)
+            assert [[r.validator_name for r in results] for results, _ in validated] == [
+                ["A", "B"],
+                ["A", "B"],
+            ]
+            assert [avg for _, avg in validated] == pytest.approx([0.7, 0.7])
+
+    def test_interactive_validators_get_one_batch(self):
+        class Person(FakeValidator):
+            interactive = True
+
+            def __init__(self, name):
+                super().__init__(name, 0.5)
+                self.batches = []
+
+            def validate(self, claim, domain="general"):
+                raise AssertionError("prompted outside validate_batch")
+
+            def validate_batch(self, claims):
+                self.batches.append(claims)
+                return [FakeValidator(self.name, 0.5).validate(c, d) for c, d in claims]
+
+        person = Person("HUMAN")
+        claims = [("Water is wet", "general"), ("Fire is hot", "general")]
+        validated = validate_claims(claims, [FakeValidator("A"), person, FakeValidator("B")])
+
+        assert person.batches == [claims]
+        assert [[r.validator_name for r in results] for results, _ in validated] == [
+            ["A", "HUMAN", "B"],
+            ["A", "HUMAN", "B"],
+        ]
+        assert validated[1][0][1].reasoning == "HUMAN checked: Fire is hot"
+
+    def test_gpt_batch(self, monkeypatch):
+        uploaded = []
+
+        def completion(i, confidence):
+            body = {
+                "choices": [
+                    {"message": {"content": json.dumps({"confidence": confidence, "reasoning": i})}}
+                ],
+                "usage": {"total_tokens": 5},
+            }
+            return {"custom_id": i, "response": {"status_code": 200, "body": body}}
+
+        class FakeOpenAI:
+            def __init__(self, api_key, http_client):
+                self.files = SimpleNamespace(create=self.upload, content=self.content)
+                self.batches = SimpleNamespace(
+                    create=lambda **kw: SimpleNamespace(id="batch_1"),
+                    retrieve=lambda batch_id: SimpleNamespace(
+                        status="completed", output_file_id="out", error_file_id="err"
+                    ),
+                )
+
+            def upload(self, file, purpose):
+                uploaded.extend(json.loads(line) for line in file[1].decode().splitlines())
+                return SimpleNamespace(id="in")
+
+            def content(self, file_id):
+                if file_id == "out":
+                    # Output order is not guaranteed by the Batch API
+                    lines = [completion("1", 0.2), completion("0", 0.9)]
+                else:
+                    lines = [{"custom_id": "2", "response": {"status_code": 429, "body": {}}}]
+                return SimpleNamespace(text="\n".join(json.dumps(line) for line in lines))
+
+        monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+        monkeypatch.setattr(validators_module, "_HAS_OPENAI", True)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        results = GPTValidator().validate_batch([("a", "general"), ("b", "general"), ("c", "x")])
+
+        assert [entry["url"] for entry in uploaded] == ["/v1/chat/completions"] * 3
+        assert [r.confidence for r in results[:2]] == [0.9, 0.2]
+        assert results[0].tokens_used == 5
+        assert not results[2].success
+
+    def test_claude_batch(self, monkeypatch):
+        def message(confidence):
+            return SimpleNamespace(
+                content=[
+                    SimpleNamespace(text=json.dumps({"confidence": confidence, "reasoning": "ok"}))
+                ],
+                usage=SimpleNamespace(input_tokens=1, output_tokens=2),
+            )
+
+        entries = [
+            SimpleNamespace(custom_id="1", result=SimpleNamespace(type="errored", error="boom")),
+            SimpleNamespace(
+                custom_id="0", result=SimpleNamespace(type="succeeded", message=message(0.6))
+            ),
+        ]
+        polls = iter(["in_progress", "ended"])
+
+        class FakeAnthropic:
+            def __init__(self, api_key, http_client):
+                batches = SimpleNamespace(
+                    create=lambda requests: SimpleNamespace(id="msgbatch_1"),
+                    retrieve=lambda batch_id: SimpleNamespace(processing_status=next(polls)),
+                    results=lambda batch_id: iter(entries),
+                )
+                self.messages = SimpleNamespace(batches=batches)
+
+        monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+        monkeypatch.setattr(validators_module, "_HAS_ANTHROPIC", True)
+        monkeypatch.setattr(validators_module.time, "sleep", lambda delay: None)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+        results = ClaudeValidator().validate_batch([("a", "general"), ("b", "general")])
+
+        assert results[0].confidence == 0.6
+        assert results[0].tokens_used == 3
+        assert "boom" in results[1].error
+
+
+class CountingValidator(FakeValidator):
+    """Cached validator that counts real calls."""
+
+    model = "fake-1"
+
+    def __init__(self, name: str = "COUNT", error: str | None = None):
+        super().__init__(name)
+        self.error = error
+
+    @cached_validation
+    def validate(self, claim: str, domain: str = "general") -> ValidationResult:
+        result = super().validate(claim, domain)  # counts the call
+        return self._failure(self.error) if self.error else result
+
+    @cached_validation
+    async def avalidate(self, claim: str, domain: str = "general") -> ValidationResult:
+        return self.validate(claim, domain, bypass_cache=True)
+
+
+class TestResponseCache:
+    """Repeated claims are answered from the persistent cache."""
+
+    def test_hit_skips_call(self):
+        validator = CountingValidator()
+        first = validator.validate("Water is wet")
+        second = validator.validate("Water is wet")
+
+        assert second == first
+        assert validator.calls == 1
+
+    def test_key_covers_domain_and_prompt_version(self, monkeypatch):
+        validator = CountingValidator()
+        validator.validate("Water is wet")
+        validator.validate("Water is wet", "physics")
+        monkeypatch.setattr(CountingValidator, "PROMPT_VERSION", "v2")
+        validator.validate("Water is wet")
+
+        assert validator.calls == 3
+
+    def test_key_fields_unambiguous(self):
+        assert ResponseCache.key("A", "m", "v1", "x:y", "z") != ResponseCache.key(
+            "A", "m", "v1", "x", "y:z"
+        )
+
+    def test_ollama_servers_cached_separately(self):
+        local = OllamaValidator("llama3")
+        remote = OllamaValidator("llama3", base_url="http://gpu-box:11434")
+
+        assert local.cache_tag != remote.cache_tag
+        assert local.cache_tag != OllamaValidator("mistral").cache_tag
+
+    def test_logos6_endpoints_cached_separately(self):
+        first = validators_module.Logos6Validator(endpoint="e1")
+        second = validators_module.Logos6Validator(endpoint="e2")
+
+        assert first.cache_tag != second.cache_tag
+        assert first != second
+
+    def test_bypass_cache(self):
+        validator = CountingValidator()
+        validator.validate("Water is wet")
+        validator.validate("Water is wet", bypass_cache=True)
+        assert validator.calls == 2
+
+    def test_errors_not_cached(self):
+        validator = CountingValidator(error="rate limited")
+        validator.validate("Water is wet")
+        validator.validate("Water is wet")
+        assert validator.calls == 2
+
+    def test_async_shares_entries(self):
+        validator = CountingValidator()
+        validator.validate("Water is wet")
+        result = asyncio.run(validator.avalidate("Water is wet"))
+
+        assert result.success
+        assert validator.calls == 1
+
+    def test_async_cache_io_off_loop(self, monkeypatch):
+        threads = []
+        original = ResponseCache.get
+
+        def get(cache, key):
+            threads.append(threading.current_thread())
+            return original(cache, key)
+
+        monkeypatch.setattr(ResponseCache, "get", get)
+        asyncio.run(CountingValidator().avalidate("Water is wet"))
+
+        assert threads and threading.main_thread() not in threads
+
+    def test_expired_entries(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=-1)
+        key = cache.key("A", "m", "v1", "claim", "general")
+        cache.put(key, FakeValidator("A").validate("claim"), "v1")
+
+        assert cache.get(key) is None
+        assert cache.prune() == 1
+
+    def test_cache_dir_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TRUTHGIT_CACHE_DIR", str(tmp_path))
+        assert get_response_cache().path == tmp_path / "responses.db"